@@ -16,7 +16,6 @@
 # This file imports and registers all required modules for this add-on.
 
 import bpy
-import bpy.utils.previews       # Imported for loading layer texture previews as icons.
 from bpy.props import PointerProperty, CollectionProperty, EnumProperty, StringProperty, BoolProperty, IntProperty
 from bpy.app.handlers import persistent
 
@@ -33,7 +32,7 @@ from .core.shaders import RYMAT_shader_name, RYMAT_shader_material_channel, RYMA
 from .core.material_layers import RYMAT_layer_stack, RYMAT_layers, RYMAT_OT_add_material_layer,RYMAT_OT_add_decal_material_layer, RYMAT_OT_add_image_layer, RYMAT_OT_delete_layer, RYMAT_OT_duplicate_layer, RYMAT_OT_move_material_layer_up, RYMAT_OT_move_material_layer_down,RYMAT_OT_toggle_material_channel_preview, RYMAT_OT_toggle_hide_layer, RYMAT_OT_set_layer_projection,RYMAT_OT_change_material_channel_value_node, RYMAT_OT_isolate_material_channel,RYMAT_OT_show_compiled_material, RYMAT_OT_toggle_image_alpha_blending, RYMAT_OT_set_material_channel, RYMAT_OT_set_matchannel_crgba_output, RYMAT_OT_set_layer_blending_mode, RYMAT_OT_merge_with_layer_below, RYMAT_OT_add_material_channel_nodes, RYMAT_OT_delete_material_channel_nodes, refresh_layer_stack, shader_node_tree_update
 
 # Layer Masks
-from .core.layer_masks import RYMAT_mask_stack, RYMAT_masks, RYMAT_UL_mask_list, RYMAT_OT_move_layer_mask_up, RYMAT_OT_move_layer_mask_down, RYMAT_OT_duplicate_layer_mask, RYMAT_OT_delete_layer_mask, RYMAT_OT_add_empty_layer_mask, RYMAT_OT_add_black_layer_mask, RYMAT_OT_add_white_layer_mask, RYMAT_OT_add_linear_gradient_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_add_ambient_occlusion_mask, RYMAT_OT_add_curvature_mask, RYMAT_OT_add_thickness_mask, RYMAT_OT_add_world_space_normals_mask,  RYMAT_OT_add_grunge_mask, RYMAT_OT_add_edge_wear_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_set_mask_projection_uv, RYMAT_OT_set_mask_projection_triplanar, RYMAT_OT_set_mask_crgba_channel, RYMAT_OT_isolate_mask
+from .core.layer_masks import RYMAT_mask_stack, RYMAT_masks, RYMAT_UL_mask_list, RYMAT_OT_move_layer_mask_up, RYMAT_OT_move_layer_mask_down, RYMAT_OT_duplicate_layer_mask, RYMAT_OT_delete_layer_mask, RYMAT_OT_add_empty_layer_mask, RYMAT_OT_add_black_layer_mask, RYMAT_OT_add_white_layer_mask, RYMAT_OT_add_linear_gradient_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_add_ambient_occlusion_mask, RYMAT_OT_add_curvature_mask, RYMAT_OT_add_thickness_mask, RYMAT_OT_add_world_space_normals_mask, RYMAT_OT_add_grunge_mask, RYMAT_OT_add_edge_wear_mask, RYMAT_OT_set_mask_projection_uv, RYMAT_OT_set_mask_projection_triplanar, RYMAT_OT_set_mask_crgba_channel, RYMAT_OT_isolate_mask
 
 # Material Filters
 from .core.material_filters import RYMAT_OT_add_material_filter, RYMAT_OT_delete_material_filter
@@ -45,7 +44,7 @@ from .core.material_slots import RYMAT_OT_add_material_slot, RYMAT_OT_remove_mat
 from .core.mesh_map_baking import RYMAT_mesh_map_anti_aliasing, RYMAT_baking_settings, RYMAT_OT_batch_bake, RYMAT_OT_set_mesh_map_folder, RYMAT_OT_open_mesh_map_folder, RYMAT_OT_preview_mesh_map, RYMAT_OT_disable_mesh_map_preview, RYMAT_OT_delete_mesh_map, RYMAT_OT_create_baking_cage, RYMAT_OT_delete_baking_cage
 
 # Exporting
-from .core.export_textures import RYMAT_pack_textures, RYMAT_RGBA_pack_channels, RYMAT_texture_export_settings, RYMAT_texture_export_settings, RYMAT_texture_set_export_settings, RYMAT_OT_export, RYMAT_OT_set_export_folder, RYMAT_OT_open_export_folder, RYMAT_OT_set_export_template, RYMAT_OT_save_export_template, RYMAT_OT_refresh_export_template_list, RYMAT_OT_delete_export_template, RYMAT_OT_add_export_texture, RYMAT_OT_remove_export_texture, RYMAT_export_template_names, ExportTemplateMenu
+from .core.export_textures import RYMAT_pack_textures, RYMAT_RGBA_pack_channels, RYMAT_texture_export_settings, RYMAT_texture_set_export_settings, RYMAT_OT_export, RYMAT_OT_set_export_folder, RYMAT_OT_open_export_folder, RYMAT_OT_set_export_template, RYMAT_OT_save_export_template, RYMAT_OT_refresh_export_template_list, RYMAT_OT_delete_export_template, RYMAT_OT_add_export_texture, RYMAT_OT_remove_export_texture, RYMAT_export_template_names, ExportTemplateMenu, LAST_EXPORT_HASHES
 
 # Utilities
 from .core.image_utilities import RYMAT_OT_save_all_textures, RYMAT_OT_add_texture_node_image, RYMAT_OT_import_texture_node_image, RYMAT_OT_edit_texture_node_image_externally, RYMAT_OT_reload_texture_node_image, RYMAT_OT_duplicate_texture_node_image, RYMAT_OT_delete_texture_node_image, RYMAT_OT_image_edit_uvs, auto_save_images
@@ -59,7 +58,7 @@ from .ui.ui_layer_stack import RYMAT_UL_layer_list, LayerBlendingModeSubMenu
 from .ui.ui_main import RYMAT_panel_properties, RyMatMainPanel
 
 # Subscription Update Handler
-from .core.subscription_update_handler import on_active_material_changed, on_active_object_changed, on_active_object_name_changed, on_active_material_index_changed, on_active_material_name_changed
+from .core.subscription_update_handler import on_active_material_changed, on_active_object_changed, on_active_object_name_changed, on_active_material_index_changed, on_active_material_name_changed, refresh_active_object
 
 # Debugging
 from .core import debug_logging
@@ -228,6 +227,20 @@ classes = (
     RyMatMainPanel
 )
 
+# Names of the objects that own subscriptions (msgbus) for this add-on.
+SUBSCRIPTION_OWNER_NAMES = (
+    'rymat_object_selection_updater',
+    'active_object_name_sub_owner',
+    'active_material_index_sub_owner',
+    'active_material_name_sub_owner'
+)
+
+# Registering a class twice raises an error when the add-on is enabled, catch duplicates here.
+assert len(set(classes)) == len(classes), "Duplicate classes defined for registration."
+
+# Register classes in order, and unregister them in reverse order so property groups are unregistered after the classes that reference them.
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 @persistent
 def depsgraph_change_handler(scene, depsgraph):
 
@@ -256,6 +269,9 @@ def on_file_load(dummy):
     # Log when a new file is loaded for debugging purposes.
     debug_logging.log("File load detected...")
 
+    # Export hashes are recorded per object and material name, which don't identify the same data in another blend file.
+    LAST_EXPORT_HASHES.clear()
+
     # Add an app handler to run updates for add-on properties when properties on the active object are changed.
     bpy.app.handlers.depsgraph_update_post.clear()
     bpy.app.handlers.depsgraph_update_post.append(depsgraph_change_handler)
@@ -283,6 +299,7 @@ def on_file_load(dummy):
 
         # Subscribe to the active objects name to get notifications when it's changed.
         bpy.types.Scene.previous_object_name = active_object.name
+        bpy.types.Scene.previous_object_pointer = active_object.as_pointer()
         bpy.msgbus.clear_by_owner(bpy.types.Scene.active_object_name_sub_owner)
         bpy.msgbus.subscribe_rna(key=active_object.path_resolve("name", False), owner=bpy.types.Scene.active_object_name_sub_owner, notify=on_active_object_name_changed, args=())
 
@@ -319,8 +336,7 @@ def post_first_depsgraph_update(scene):
 
 def register():
     # Register properties, operators and pannels.
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
 
     # Scene Properties
     bpy.types.Scene.rymat_panel_properties = PointerProperty(type=RYMAT_panel_properties)
@@ -379,14 +395,14 @@ def register():
     bpy.app.handlers.depsgraph_update_post.append(post_first_depsgraph_update)
 
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
 
-    # Empty objects that manage subscription updating.
-    bpy.types.Scene.rymat_object_selection_updater = None
-    bpy.types.Scene.active_object_name_sub_owner = None
-    bpy.types.Scene.active_material_index_sub_owner = None
-    bpy.types.Scene.active_material_name_sub_owner = None
+    # Remove subscriptions and empty objects that manage subscription updating.
+    for owner_name in SUBSCRIPTION_OWNER_NAMES:
+        owner = getattr(bpy.types.Scene, owner_name, None)
+        if owner:
+            bpy.msgbus.clear_by_owner(owner)
+        setattr(bpy.types.Scene, owner_name, None)
 
     # Unregister the load handler.
     if on_file_load in bpy.app.handlers.load_post:
@@ -400,5 +416,9 @@ def unregister():
     if bpy.app.timers.is_registered(auto_save_images):
         bpy.app.timers.unregister(auto_save_images)
 
+    # Unregister a pending layer stack refresh for the active object.
+    if bpy.app.timers.is_registered(refresh_active_object):
+        bpy.app.timers.unregister(refresh_active_object)
+
 if __name__ == "__main__":
     register()
\ No newline at end of file
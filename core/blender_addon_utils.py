@@ -9,6 +9,7 @@ import re
 import platform
 import subprocess
 from pathlib import Path
+from mathutils import Color
 from ..core import texture_set_settings as tss
 from ..core import debug_logging
 from .. import preferences
@@ -268,15 +269,6 @@ def get_node_by_bl_static_type(nodes, bl_static_type):
 
 def create_image(new_image_name, image_width=-1, image_height=-1, base_color=(0.0, 0.0, 0.0, 1.0), generate_type='BLANK', alpha_channel=False, thirty_two_bit=False, add_unique_id=False, delete_existing=False):
     '''Creates a new image in blend data.'''
-    if delete_existing:
-        existing_image = bpy.data.images.get(new_image_name)
-        if existing_image:
-            bpy.data.images.remove(existing_image)
-
-    if add_unique_id:
-        new_image_name = "{0}_{1}".format(new_image_name, str(random.randrange(10000,99999)))
-        while bpy.data.images.get(new_image_name) != None:
-            new_image_name = "{0}_{1}".format(new_image_name, str(random.randrange(10000,99999)))
 
     # If -1 is passed, use the image resolution defined in the texture set settings.
     if image_width == -1:
@@ -289,17 +281,40 @@ def create_image(new_image_name, image_width=-1, image_height=-1, base_color=(0.
     else:
         h = image_height
 
-    bpy.ops.image.new(name=new_image_name, 
-                      width=w, 
-                      height=h,
-                      color=base_color, 
-                      alpha=alpha_channel, 
-                      generated_type=generate_type,
-                      float=thirty_two_bit,
-                      use_stereo_3d=False, 
-                      tiled=False)
-
-    return bpy.data.images.get(new_image_name)
+    if delete_existing:
+        existing_image = bpy.data.images.get(new_image_name)
+        if existing_image:
+            bpy.data.images.remove(existing_image)
+
+    if add_unique_id:
+        new_image_name = "{0}_{1}".format(new_image_name, str(random.randrange(10000,99999)))
+        while bpy.data.images.get(new_image_name) != None:
+            new_image_name = "{0}_{1}".format(new_image_name, str(random.randrange(10000,99999)))
+
+    # Create the image directly in blend data, the image.new operator is slower (undo push, redraws) and requires looking up the image by name after it's created.
+    new_image = bpy.data.images.new(name=new_image_name,
+                                    width=w,
+                                    height=h,
+                                    alpha=alpha_channel,
+                                    float_buffer=thirty_two_bit,
+                                    stereo3d=False,
+                                    tiled=False)
+
+    # Changing generated image settings re-generates the full image, only change settings that differ from the defaults for new images.
+    if new_image.generated_type != generate_type:
+        new_image.generated_type = generate_type
+
+    # Match the base color the image.new operator would fill the image with.
+    # Images without alpha are opaque, and colors for byte images are converted to sRGB.
+    color = list(base_color)
+    if not alpha_channel:
+        color[3] = 1.0
+    if not thirty_two_bit:
+        color[:3] = Color(color[:3]).from_scene_linear_to_srgb()
+    if tuple(new_image.generated_color) != tuple(color):
+        new_image.generated_color = color
+
+    return new_image
     
 def create_data_image(image_name, image_width, image_height, alpha_channel=False, thirty_two_bit=False, data=False, delete_existing=True):
     '''Creates a new data based image in the blend file.'''
@@ -393,22 +408,27 @@ def get_texture_folder_path(folder='RAW_TEXTURES'):
             debug_logging.log("Error: Invalid folder provided to get_texture_folder_path.")
             return ""
 
-    # Return the custom folder path.
+    # Return the custom folder path, fall back to the default folder if the custom folder is invalid.
     if custom_folder != 'Default':
-        if not os.path.isdir(custom_folder):
-            debug_logging.log("Folder is invalid, image was saved to: {0}".format(default_path), sub_process=False)
-        return custom_folder
+        if os.path.isdir(custom_folder):
+            return custom_folder
+        debug_logging.log("Folder is invalid, image was saved to: {0}".format(default_path), sub_process=False)
 
     # Return the default folder.
-    if os.path.exists(default_path) == False:
-        os.mkdir(default_path)
-    return default_path
+    return ensure_folder(default_path)
+
+def ensure_folder(folder_path):
+    '''Creates the provided folder if it doesn't exist and returns it.'''
+    # The folder is checked every call (rather than cached) because users can delete folders while the add-on is running.
+    if not os.path.isdir(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+    return folder_path
 
 def get_raw_texture_file_path(image_name, file_format='OPEN_EXR'):
     '''Returns the file path for where raw textures should be saved. Raw textures are categorized as any image used in the material editing process that isn't a final texture.'''
     export_path = get_texture_folder_path(folder='RAW_TEXTURES')
     file_extension = get_image_file_extension(file_format)
-    return "{0}/{1}.{2}".format(export_path, image_name, file_extension)
+    return os.path.join(export_path, "{0}.{1}".format(image_name, file_extension))
 
 def save_image(image, file_format='PNG', image_category='RAW_TEXTURE', colorspace='sRGB'):
     '''Saves the provided image to the default or defined location for the provided asset type. Valid types include: RAW_TEXTURE, EXPORT_TEXTURE'''
@@ -423,12 +443,12 @@ def save_image(image, file_format='PNG', image_category='RAW_TEXTURE', colorspac
     file_extension = get_image_file_extension(file_format)
     image.colorspace_settings.name = colorspace
     image.file_format = file_format
-    image.filepath = "{0}/{1}.{2}".format(export_path, image.name, file_extension)
+    image.filepath = os.path.join(export_path, "{0}.{1}".format(image.name, file_extension))
     image.save()
 
 def verify_addon_material(material):
     '''Verifies the material is created with this add-on.'''
-    if material:
+    if material and material.node_tree:
         if material.node_tree.nodes.get('SHADER_NODE') != None:
             return True
         else:
@@ -437,12 +457,15 @@ def verify_addon_material(material):
 
 def verify_addon_active_material(context):
     '''Verifies there is an active object, active material, and the material is created with this add-on.'''
-    if not context.active_object:
+    active_object = context.active_object
+    if not active_object:
         return False
-    elif not context.active_object.active_material:
+
+    active_material = active_object.active_material
+    if not active_material:
         return False
     else:
-        return verify_addon_material(context.active_object.active_material)
+        return verify_addon_material(active_material)
 
 def set_snapping(snapping_mode, snap_on=True):
     '''Sets ideal snapping settings for the specified mode.'''
@@ -2,6 +2,7 @@
 
 import os
 import time
+import hashlib
 import numpy
 import json
 import copy
@@ -289,52 +290,105 @@ default_json_file = {
   ]
 }
 
-BIT_DEPTH = [
+BIT_DEPTH = (
     ("EIGHT", "8-bit", "8-bit depth is the standard color bit depth for games"),
     ("THIRTY_TWO", "32-bit", "32-bit uses more memory in RGB channels, but will result in less color banding (not visible on old monitors)")
-]
+)
 
-NORMAL_MAP_MODE = [
+NORMAL_MAP_MODE = (
     ("OPEN_GL", "OpenGL", "Normal maps will be exported in Open GL format (same as they are in Blender)"),
     ("DIRECTX", "DirectX", "Exported normal maps will have their green channel automatically inverted so they export in Direct X format")
-]
+)
 
-ROUGHNESS_MODE = [
+ROUGHNESS_MODE = (
     ("ROUGHNESS", "Roughness", "Roughness will be exported as is."),
     ("SMOOTHNESS", "Smoothness", "Roughness textures will be converted (inverted) to smoothness textures before exporting / packing. This supports some software which uses smoothness maps (e.g. Unity).")
-]
+)
 
-RGBA_PACKING_CHANNELS = [
+RGBA_PACKING_CHANNELS = (
     ("R", "R", "Red Channel"),
     ("G", "G", "Green Channel"),
     ("B", "B", "Blue Channel"),
     ("A", "A", "Alpha Channel")
-]
+)
 
-TEXTURE_EXPORT_FORMAT = [
+TEXTURE_EXPORT_FORMAT = (
     ("PNG", "png", "Exports the selected material channel in png texture format. This is a non-compressed format, and generally a good default"),
     ("JPEG", "jpg", "Exports the selected material channel in JPG texture format. This is a compressed format, which could be used for textures applied to models that will be shown in a web browser"),
     ("TARGA", "tga", "Exports the selected material channel in TARGA texture format"),
     ("OPEN_EXR", "exr", "Exports the selected material channel in open exr texture format")
-]
+)
 
-EXPORT_MODE = [
+EXPORT_MODE = (
     ("ONLY_ACTIVE_MATERIAL", "Only Active Material", "Export only the active material to a texture set"),
     ("EXPORT_ALL_MATERIALS", "Export All Materials", "Exports every object on the active material as it's own texture set"),
     ("SINGLE_TEXTURE_SET", "Single Texture Set", "Bakes all materials in all texture slots on the active object to 1 texture set. Separating the final material into separate smaller materials assigned to different parts of the mesh and then baking them to a single texture set can be efficient for workflow, and can reduce shader compilation time while editing")
-]
+)
 
 # Available colorspace settings for exported textures.
-IMAGE_COLORSPACE_SETTINGS = [
+IMAGE_COLORSPACE_SETTINGS = (
     ("SRGB", "sRGB", ""),
     ("NON_COLOR", "Non-Color", "")
-]
+)
 
 # List of channels that should be baked using normal baking instead of the default emission baking.
-NORMAL_BAKE_CHANNELS = [
+NORMAL_BAKE_CHANNELS = (
     'NORMAL',
     'NORMAL_HEIGHT-MIX'
-]
+)
+
+# Property names for pack texture and RGBA pack channel settings in RGBA order.
+# Defined once here, so they don't need to be read from the property group annotations for every exported texture.
+PACK_TEXTURE_PROPERTIES = ('r_texture', 'g_texture', 'b_texture', 'a_texture')
+PACK_COLOR_CHANNEL_PROPERTIES = ('r_color_channel', 'g_color_channel', 'b_color_channel', 'a_color_channel')
+
+# Pixel array offsets for each color channel (pixels are stored RGBA).
+COLOR_CHANNEL_INDICES = {
+    'R': 0,
+    'G': 1,
+    'B': 2,
+    'A': 3
+}
+
+# Node properties that only affect how nodes are displayed, these are ignored when hashing material node trees for export.
+EXPORT_HASH_IGNORED_NODE_PROPERTIES = {
+    'name',
+    'label',
+    'location',
+    'width',
+    'height',
+    'width_hidden',
+    'select',
+    'hide',
+    'mute',
+    'show_options',
+    'show_preview',
+    'show_texture',
+    'color',
+    'use_custom_color'
+}
+
+# Nodes added to materials while exporting, these are ignored when hashing material node trees for export.
+EXPORT_HASH_IGNORED_NODES = {
+    'BAKE_IMAGE',
+    'BAKE_NODE'
+}
+
+# Bake settings changed when exporting textures, these are reset to their original values after exporting.
+EXPORT_BAKE_SETTINGS = (
+    'use_clear',
+    'margin',
+    'use_selected_to_active',
+    'use_pass_direct',
+    'use_pass_indirect'
+)
+
+# Hashes of the material node trees and export settings for the last exported texture sets, keyed by (object name, material name).
+LAST_EXPORT_HASHES = {}
+
+# Cached enum items for shader channels that can be channel packed, along with the shader channel names they were built from.
+# Blender requires Python to keep a reference to dynamic enum items, otherwise their strings can be freed while they are still displayed.
+SHADER_CHANNEL_ENUM_ITEMS = {'channel_names': None, 'items': []}
 
 
 #----------------------------- CHANNEL PACKING / IMAGE EDITING FUNCTIONS -----------------------------#
@@ -344,50 +398,40 @@ def format_baked_material_channel_name(material_name, material_channel_name):
     '''Properly formats the baked material channel name.'''
     return "RY_{0}_{1}".format(material_name.replace('_', ''), material_channel_name.capitalize())
 
-def enumerate_color_channel(color_channel):
-    '''Returns an interger value for the provided color channel.'''
-    match color_channel:
-        case 'R':
-            return 0
-        
-        case 'G':
-            return 1
-        
-        case 'B':
-            return 2
-        
-        case 'A':
-            return 3
-
 def channel_pack(pack_textures, input_packing, output_packing, image_name_format, color_bit_depth, file_format, export_colorspace):
     '''Channel packs the provided images into RGBA channels of a single image. Accepts None.'''
 
     # Create an array of output pixels using the first valid input texture.
     # Initialize full size empty arrays to avoid using dynamic arrays (caused by appending) which is much much slower.
     output_pixels = None
-    source_pixels = None
-    for channel_index in range(0, 4):
-        image = pack_textures[channel_index]
+    for image in pack_textures:
         if image:
             w, h = image.size
-            source_pixels = numpy.empty(w * h * 4, dtype=numpy.float32)
             output_pixels = numpy.ones(w * h * 4, dtype=numpy.float32)
+            break
 
     # Cycle through and pack RGBA channels.
+    # Pixels are read once per source image, the same image is often packed into multiple channels (i.e RGB from a color texture).
+    source_pixels_cache = {}
     for channel_index in range(0, 4):
         image = pack_textures[channel_index]
         if image:
+            source_pixels = source_pixels_cache.get(image.name)
+            if source_pixels is None:
 
-            # All packed images must be the same size for packing.
-            # In some rare cases textures being packed could be different resolutions.
-            # If this is the case, we'll re-scale the mesh maps to match the current texture set resolution so channel packing can occur.
-            if image.size[0] != w or image.size[1] != h:
-                image.scale(tss.get_texture_width(), tss.get_texture_height())
-                debug_logging.log("Re-scaled {0} to match the texture set resolution for channel packing.".format(image.name))
+                # All packed images must be the same size for packing.
+                # In some rare cases textures being packed could be different resolutions.
+                # If this is the case, we'll re-scale the mesh maps to match the current texture set resolution so channel packing can occur.
+                if image.size[0] != w or image.size[1] != h:
+                    image.scale(tss.get_texture_width(), tss.get_texture_height())
+                    debug_logging.log("Re-scaled {0} to match the texture set resolution for channel packing.".format(image.name))
+
+                source_pixels = numpy.empty(w * h * 4, dtype=numpy.float32)
+                image.pixels.foreach_get(source_pixels)
+                source_pixels_cache[image.name] = source_pixels
 
             # Copy the source image R pixels (source pixels 0 = R, 1 = G, 2 = B, 3 = A) to the output image pixels for each channel.
             # Skip 4 elements using extended slice because there are 4 elements in each pixel (RGBA).
-            image.pixels.foreach_get(source_pixels)
             output_pixels[output_packing[channel_index]::4] = source_pixels[input_packing[channel_index]::4]
         
         # If 'None' is used as a pack texture, fill the pixels with a default value.
@@ -435,7 +479,7 @@ def channel_pack(pack_textures, input_packing, output_packing, image_name_format
     file_extension = bau.get_image_file_extension(file_format)
     export_path = bau.get_texture_folder_path(folder='EXPORT_TEXTURES')
     packed_image.file_format = file_format
-    packed_image.filepath = "{0}/{1}.{2}".format(export_path, image_name, file_extension)
+    packed_image.filepath = os.path.join(export_path, "{0}.{1}".format(image_name, file_extension))
     packed_image.pixels.foreach_set(output_pixels)
     packed_image.save()
    
@@ -479,8 +523,9 @@ def channel_pack_textures(texture_set_name):
         # Compile an array of baked images that will be used in channel packing based on the defined input texture...
         # ... and perform image alterations to select channels (normal / roughness / smoothness).
         input_images = []
-        for key in export_texture.pack_textures.__annotations__.keys():
-            texture_channel = getattr(export_texture.pack_textures, key)
+        pack_textures = export_texture.pack_textures
+        for key in PACK_TEXTURE_PROPERTIES:
+            texture_channel = getattr(pack_textures, key)
 
             match texture_channel:
                 case 'ROUGHNESS':
@@ -523,15 +568,11 @@ def channel_pack_textures(texture_set_name):
         if all(image is None for image in input_images):
             continue
 
-        input_packing_channels = []
-        for key in export_texture.input_rgba_channels.__annotations__.keys():
-            color_channel_index = enumerate_color_channel(getattr(export_texture.input_rgba_channels, key))
-            input_packing_channels.append(color_channel_index)
+        input_rgba_channels = export_texture.input_rgba_channels
+        input_packing_channels = [COLOR_CHANNEL_INDICES[getattr(input_rgba_channels, key)] for key in PACK_COLOR_CHANNEL_PROPERTIES]
 
-        output_packing_channels = []
-        for key in export_texture.output_rgba_channels.__annotations__.keys():
-            color_channel_index = enumerate_color_channel(getattr(export_texture.output_rgba_channels, key))
-            output_packing_channels.append(color_channel_index)
+        output_rgba_channels = export_texture.output_rgba_channels
+        output_packing_channels = [COLOR_CHANNEL_INDICES[getattr(output_rgba_channels, key)] for key in PACK_COLOR_CHANNEL_PROPERTIES]
 
         # Channel pack baked material channels / textures.
         channel_pack(
@@ -599,12 +640,20 @@ def format_export_image_name(texture_name_format):
 def get_texture_channel_bake_list():
     '''Returns a list of material channels required to be baked as defined in the texture export settings.'''
     texture_export_settings = bpy.context.scene.rymat_texture_export_settings
+
+    # Validate material channels here once per export, using a set of valid channel names for fast lookups.
+    valid_channel_names = frozenset(shaders.get_static_shader_channel_list())
+
     material_channels_to_bake = []
     for export_texture in texture_export_settings.export_textures:
-        for key in export_texture.pack_textures.__annotations__.keys():
-            input_texture_channel = getattr(export_texture.pack_textures, key)
+        pack_textures = export_texture.pack_textures
+        for key in PACK_TEXTURE_PROPERTIES:
+            input_texture_channel = getattr(pack_textures, key)
             if input_texture_channel not in material_channels_to_bake:
                 if input_texture_channel != 'NONE':
+                    if input_texture_channel not in valid_channel_names:
+                        debug_logging.log("Can't bake invalid material channel: {0}".format(input_texture_channel))
+                        continue
                     material_channels_to_bake.append(input_texture_channel)
 
     # Normal map data bakes blank if they are baked before other maps, it's unclear why.
@@ -618,6 +667,171 @@ def get_texture_channel_bake_list():
     debug_logging.log("Baking channels: {0}".format(material_channels_to_bake))
     return material_channels_to_bake
 
+def get_hashable_value(value):
+    '''Returns the provided property value in a form that can be consistently written into an export hash.'''
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    if isinstance(value, bpy.types.Object):
+        return (value.name, get_hashable_value(value.matrix_world))
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    if hasattr(value, '__len__'):
+        return tuple(get_hashable_value(v) for v in value)
+    return None
+
+def get_image_hash_data(image):
+    '''Returns data used to detect changes to the provided image when hashing material node trees for export. Returns None if the image has unsaved changes.'''
+    if image.is_dirty:
+        return None
+
+    # Use the file modification time so edits saved to the image file are detected.
+    image_path = bpy.path.abspath(image.filepath_raw)
+    modified_time = None
+    if image_path and os.path.exists(image_path):
+        modified_time = os.path.getmtime(image_path)
+
+    packed_size = None
+    if image.packed_file:
+        packed_size = image.packed_file.size
+
+    return (image.name, image.filepath_raw, tuple(image.size), image.source, image.colorspace_settings.name, modified_time, packed_size)
+
+def get_color_ramp_hash_data(color_ramp):
+    '''Returns data used to detect changes to the provided color ramp when hashing material node trees for export.'''
+    elements = tuple((element.position, tuple(element.color)) for element in color_ramp.elements)
+    return (color_ramp.interpolation, color_ramp.color_mode, color_ramp.hue_interpolation, elements)
+
+def get_curve_mapping_hash_data(curve_mapping):
+    '''Returns data used to detect changes to the provided curve mapping (i.e RGB curves) when hashing material node trees for export.'''
+    curves = tuple(tuple((tuple(point.location), point.handle_type) for point in curve.points) for curve in curve_mapping.curves)
+    return (curve_mapping.use_clip, tuple(curve_mapping.black_level), tuple(curve_mapping.white_level), curve_mapping.extend, curves)
+
+def get_node_tree_hash_data(node_tree, hash_data, hashed_node_trees):
+    '''Appends data for all nodes and links in the provided node tree (and the node groups it uses) to the provided hash data. Returns False if the node tree can't be hashed.'''
+    if node_tree.name in hashed_node_trees:
+        return True
+    hashed_node_trees.add(node_tree.name)
+    hash_data.append(node_tree.name)
+
+    for node in node_tree.nodes:
+        if node.name in EXPORT_HASH_IGNORED_NODES:
+            continue
+
+        hash_data.append((node.bl_idname, node.name, node.mute))
+
+        # Record node properties that affect the node output (blend modes, interpolation, etc).
+        for node_property in node.bl_rna.properties:
+            if node_property.is_readonly or node_property.identifier in EXPORT_HASH_IGNORED_NODE_PROPERTIES:
+                continue
+            if node_property.type in {'BOOLEAN', 'INT', 'FLOAT', 'ENUM', 'STRING'}:
+                hash_data.append((node_property.identifier, get_hashable_value(getattr(node, node_property.identifier))))
+
+            # Record data-blocks referenced by nodes, objects (i.e decal empties) are recorded with their transform so moving them is detected.
+            elif node_property.type == 'POINTER':
+                value = getattr(node, node_property.identifier)
+                if isinstance(value, bpy.types.ID):
+                    hash_data.append((node_property.identifier, get_hashable_value(value)))
+
+                # Color ramps and curves aren't data-blocks, record their elements and points so edits to them are detected.
+                elif isinstance(value, bpy.types.ColorRamp):
+                    hash_data.append((node_property.identifier, get_color_ramp_hash_data(value)))
+                elif isinstance(value, bpy.types.CurveMapping):
+                    hash_data.append((node_property.identifier, get_curve_mapping_hash_data(value)))
+
+        for node_input in node.inputs:
+            hash_data.append((node_input.identifier, get_hashable_value(getattr(node_input, 'default_value', None))))
+
+        # Images and node groups used in the node tree can change without the node tree changing.
+        image = getattr(node, 'image', None)
+        if image:
+            image_hash_data = get_image_hash_data(image)
+            if image_hash_data == None:
+                return False
+            hash_data.append(image_hash_data)
+
+        if node.type == 'GROUP' and node.node_tree:
+            if not get_node_tree_hash_data(node.node_tree, hash_data, hashed_node_trees):
+                return False
+
+    for link in node_tree.links:
+        if link.from_node.name in EXPORT_HASH_IGNORED_NODES or link.to_node.name in EXPORT_HASH_IGNORED_NODES:
+            continue
+        hash_data.append((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier, link.is_muted))
+
+    return True
+
+def get_mesh_hash_data(active_object):
+    '''Returns data used to detect changes to the provided objects transform, evaluated mesh geometry (including modifiers), UV maps and face material assignments when hashing materials for export.'''
+    # Hash the evaluated mesh, baking uses the mesh with all modifiers applied.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    evaluated_object = active_object.evaluated_get(depsgraph)
+    mesh = evaluated_object.to_mesh()
+
+    vertex_positions = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', vertex_positions)
+    material_indices = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('material_index', material_indices)
+    hash_data = [
+        get_hashable_value(active_object.matrix_world),
+        len(mesh.vertices),
+        len(mesh.polygons),
+        hashlib.blake2b(vertex_positions.tobytes(), digest_size=16).hexdigest(),
+        hashlib.blake2b(material_indices.tobytes(), digest_size=16).hexdigest()
+    ]
+
+    for uv_layer in mesh.uv_layers:
+        uv_positions = numpy.empty(len(uv_layer.data) * 2, dtype=numpy.float32)
+        uv_layer.data.foreach_get('uv', uv_positions)
+        hash_data.append((uv_layer.name, hashlib.blake2b(uv_positions.tobytes(), digest_size=16).hexdigest()))
+
+    evaluated_object.to_mesh_clear()
+    return hash_data
+
+def get_material_export_hash(material, mesh_hash_data):
+    '''Returns a hash of the material node tree, the provided object mesh hash data and all settings that affect textures exported for the material. Returns None if the material can't be hashed (i.e has unsaved images).'''
+    scene = bpy.context.scene
+    texture_export_settings = scene.rymat_texture_export_settings
+
+    # Record export settings, changing any of these changes the exported textures.
+    hash_data = [
+        texture_export_settings.export_preset_name,
+        texture_export_settings.roughness_mode,
+        texture_export_settings.normal_map_mode,
+        texture_export_settings.samples,
+        scene.rymat_baking_settings.uv_padding,
+        tss.get_texture_width(),
+        tss.get_texture_height(),
+        bau.get_texture_folder_path(folder='EXPORT_TEXTURES')
+    ]
+    hash_data.extend(mesh_hash_data)
+    for export_texture in texture_export_settings.export_textures:
+        hash_data.append((export_texture.name_format, export_texture.image_format, export_texture.bit_depth, export_texture.colorspace))
+        hash_data.append(tuple(getattr(export_texture.pack_textures, key) for key in PACK_TEXTURE_PROPERTIES))
+        hash_data.append(tuple(getattr(export_texture.input_rgba_channels, key) for key in PACK_COLOR_CHANNEL_PROPERTIES))
+        hash_data.append(tuple(getattr(export_texture.output_rgba_channels, key) for key in PACK_COLOR_CHANNEL_PROPERTIES))
+
+    if not get_node_tree_hash_data(material.node_tree, hash_data, set()):
+        return None
+
+    return hashlib.blake2b(repr(hash_data).encode('utf-8'), digest_size=16).hexdigest()
+
+def verify_exported_textures_exist():
+    '''Returns true if all textures defined in the texture export settings exist in the export folder for the active material.'''
+    texture_export_settings = bpy.context.scene.rymat_texture_export_settings
+    export_path = bau.get_texture_folder_path(folder='EXPORT_TEXTURES')
+    for export_texture in texture_export_settings.export_textures:
+        pack_textures = export_texture.pack_textures
+        if all(getattr(pack_textures, key) == 'NONE' for key in PACK_TEXTURE_PROPERTIES):
+            continue
+
+        image_name = format_export_image_name(export_texture.name_format)
+        file_extension = bau.get_image_file_extension(export_texture.image_format)
+        if not os.path.exists(os.path.join(export_path, "{0}.{1}".format(image_name, file_extension))):
+            return False
+    return True
+
 def set_export_template(export_preset_name):
     '''Applies the export template settings stored in the specified export template from the export template json file.'''
     texture_export_settings = bpy.context.scene.rymat_texture_export_settings
@@ -657,14 +871,8 @@ def set_export_template(export_preset_name):
     return
 
 def bake_material_channel(material_channel_name, single_texture_set=False):
-    '''Bakes the defined material channel to an image texture and stores it in Blender's data. Returns true if baking was successful.'''
+    '''Bakes the defined material channel to an image texture and stores it in Blender's data. Material channels are validated in get_texture_channel_bake_list. Returns true if baking was successful.'''
 
-    # Ensure the material channel name provided is valid to bake.
-    static_channel_list = shaders.get_static_shader_channel_list()
-    if material_channel_name not in static_channel_list:
-        debug_logging.log("Can't bake invalid material channel: {0}".format(material_channel_name))
-        return ""
-    
     # Assign normal map image background color the default RGB color for 'UP' in Blender.
     if material_channel_name == 'NORMAL':
         background_color = (0.735337, 0.735337, 1.0, 1.0)
@@ -672,8 +880,10 @@ def bake_material_channel(material_channel_name, single_texture_set=False):
         background_color = (0.0, 0.0, 0.0, 1.0)
 
     # For baking multiple materials to a single texture set use one image that uses the name of the active object.
+    active_object = bpy.context.active_object
+    active_material = active_object.active_material
     if single_texture_set:
-        object_name = bpy.context.active_object.name.replace('_', '')
+        object_name = active_object.name.replace('_', '')
         image_name = format_baked_material_channel_name(object_name, material_channel_name)
         export_image = bpy.data.images.get(image_name)
         if export_image == None:
@@ -691,7 +901,7 @@ def bake_material_channel(material_channel_name, single_texture_set=False):
 
     # For baking individual materials to textures, create new images to bake to for each material.
     else:
-        material_name = bpy.context.active_object.active_material.name.replace('_', '')
+        material_name = active_material.name.replace('_', '')
         image_name = format_baked_material_channel_name(material_name, material_channel_name)
         export_image = bau.create_image(
             new_image_name=image_name,
@@ -706,7 +916,8 @@ def bake_material_channel(material_channel_name, single_texture_set=False):
         )
     
     # Add the baking image to the bake texture node.
-    material_nodes = bpy.context.active_object.active_material.node_tree.nodes
+    active_node_tree = active_material.node_tree
+    material_nodes = active_node_tree.nodes
     image_node = material_nodes.get('BAKE_IMAGE')
     image_node.image = export_image
     image_node.select = True
@@ -714,12 +925,11 @@ def bake_material_channel(material_channel_name, single_texture_set=False):
     bau.set_texture_paint_image(export_image)
     
     # Link to a bake node.
-    active_node_tree = bpy.context.active_object.active_material.node_tree
     bake_node = get_bake_node()
-    material_output = active_node_tree.nodes.get('MATERIAL_OUTPUT')
+    material_output = material_nodes.get('MATERIAL_OUTPUT')
 
     output_socket_name = shaders.get_shader_channel_socket_name(material_channel_name)
-    total_layers = material_layers.count_layers(bpy.context.active_object.active_material)
+    total_layers = material_layers.count_layers(active_material)
     for i in range(total_layers, 0, -1):
         layer_node = material_layers.get_material_layer_node('LAYER', i - 1)
         if bau.get_node_active(layer_node):
@@ -729,14 +939,16 @@ def bake_material_channel(material_channel_name, single_texture_set=False):
                 bau.safe_node_link(layer_node.outputs.get(output_socket_name), bake_node.inputs.get('Color'), active_node_tree)
             break
 
-    active_node_tree.links.new(bake_node.outputs[0], material_output.inputs[0])
+    # The bake node only needs to be linked to the material output once per material, not for every baked material channel.
+    material_output_links = material_output.inputs[0].links
+    if len(material_output_links) <= 0 or material_output_links[0].from_node != bake_node:
+        active_node_tree.links.new(bake_node.outputs[0], material_output.inputs[0])
 
     # Trigger a baking operation based on the material channel being baked.
+    # Direct and indirect lighting passes are disabled for diffuse bakes when exporting starts.
     if material_channel_name == 'NORMAL':
         bpy.ops.object.bake('INVOKE_DEFAULT', type='NORMAL')
     else:
-        bpy.context.scene.render.bake.use_pass_direct = False
-        bpy.context.scene.render.bake.use_pass_indirect = False
         bpy.ops.object.bake('INVOKE_DEFAULT', type='DIFFUSE')
     
     return export_image.name
@@ -745,14 +957,21 @@ def add_bake_texture_nodes():
     '''Adds a bake texture node to all materials in all material slots on the active object.'''
 
     # Adding a placeholder image to the bake image nodes stops Blender from throwing annoying and incorrect 'no active image' warnings when baking'.
-    placeholder_image = bau.create_data_image("RY_Placeholder", image_width=32, image_height=32)
+    placeholder_image = bpy.data.images.get("RY_Placeholder")
+    if not placeholder_image:
+        placeholder_image = bau.create_data_image("RY_Placeholder", image_width=32, image_height=32)
 
     active_object = bpy.context.active_object
     for material_slot in active_object.material_slots:
         if material_slot.material:
-            bake_texture_node = material_slot.material.node_tree.nodes.new('ShaderNodeTexImage')
-            bake_texture_node.name = 'BAKE_IMAGE'
-            bake_texture_node.label = bake_texture_node.name
+
+            # Reuse an existing bake texture node (i.e left from an interrupted bake) instead of adding a duplicate.
+            # Duplicate nodes would be renamed by Blender and never receive the bake image.
+            bake_texture_node = material_slot.material.node_tree.nodes.get('BAKE_IMAGE')
+            if not bake_texture_node:
+                bake_texture_node = material_slot.material.node_tree.nodes.new('ShaderNodeTexImage')
+                bake_texture_node.name = 'BAKE_IMAGE'
+                bake_texture_node.label = bake_texture_node.name
             bake_texture_node.image = placeholder_image
             bake_texture_node.select = True
             material_slot.material.node_tree.nodes.active = bake_texture_node
@@ -783,9 +1002,7 @@ def remove_bake_texture_nodes():
 
 def read_export_template_data():
     '''Reads json data from the export template file. Creates a new export template json file if one does not exist.'''
-    template_folder_path = str(Path(resource_path('USER')) / "scripts/addons" / ADDON_NAME / "json_data")
-    if not os.path.exists(template_folder_path):
-        os.mkdir(template_folder_path)
+    template_folder_path = bau.ensure_folder(str(Path(resource_path('USER')) / "scripts/addons" / ADDON_NAME / "json_data"))
 
     # If the export template doesn't exist, create a new default one.
     templates_json_path = os.path.join(template_folder_path, "texture_export_presets.json")
@@ -826,31 +1043,39 @@ def read_export_template_names():
 
 def get_shader_channel_enum_items(scene=None, context=None):
     '''Returns an enum list of current shader channels that can be used in RGBA channel packing.'''
-    items = []
+    shader_info = bpy.context.scene.rymat_shader_info
+    channel_names = tuple(channel.name for channel in shader_info.material_channels)
 
-    # Add a 'NONE' ENUM option for when no texture needs to be channel packed in an RGBA channel.
-    items += [("NONE", "None", "None")]
+    # Only rebuild the enum items when the shader channels have changed, this is called for each channel packing property every time the export UI is drawn.
+    if channel_names != SHADER_CHANNEL_ENUM_ITEMS['channel_names']:
 
-    # Add an ENUM option for all shader channels.
-    shader_info = bpy.context.scene.rymat_shader_info
-    for channel in shader_info.material_channels:
-        items += [(
-            bau.format_static_matchannel_name(channel.name),
-            channel.name,
-            ""
-        )]
-    
-    return items
+        # Add a 'NONE' ENUM option for when no texture needs to be channel packed in an RGBA channel.
+        items = [("NONE", "None", "None")]
+
+        # Add an ENUM option for all shader channels.
+        for channel_name in channel_names:
+            items.append((
+                bau.format_static_matchannel_name(channel_name),
+                channel_name,
+                ""
+            ))
+
+        SHADER_CHANNEL_ENUM_ITEMS['channel_names'] = channel_names
+        SHADER_CHANNEL_ENUM_ITEMS['items'] = items
+
+    return SHADER_CHANNEL_ENUM_ITEMS['items']
 
 def verify_exporting_texture_context(context):
     '''Runs checks to verify if exporting textures is possible. If exporting textures is invalid, an info message will be returned.'''
-    if not context.active_object:
+    active_object = context.active_object
+    if not active_object:
         return False
     
-    if context.active_object.active_material == None:
+    active_material = active_object.active_material
+    if active_material == None:
         return False
     
-    if bau.verify_addon_material(context.active_object.active_material) == False:
+    if bau.verify_addon_material(active_material) == False:
         return False
 
     return True
@@ -904,6 +1129,8 @@ class RYMAT_OT_export(Operator):
     _texture_channels_to_bake = []
     _mesh_map_channels_to_bake = []
     _original_render_engine_name = ""
+    _original_bake_settings = {}
+    _original_samples = 0
     _bake_image_name = ""
     _start_bake_time = 0
 
@@ -921,61 +1148,68 @@ class RYMAT_OT_export(Operator):
 
             # Detect when baking is finished...
             if not bpy.app.is_job_running('OBJECT_BAKE'):
+                active_object = context.active_object
+                texture_export_settings = context.scene.rymat_texture_export_settings
+                single_texture_set = texture_export_settings.export_mode == 'SINGLE_TEXTURE_SET'
+
+                # Skip baking texture sets for materials that haven't changed since they were last exported.
+                if self._texture_channel_index == -1 and not single_texture_set:
+                    active_material = active_object.active_material
+                    material_export_hash = self._material_export_hashes.get(active_material.name)
+                    if material_export_hash != None and LAST_EXPORT_HASHES.get((active_object.name, active_material.name)) == material_export_hash and verify_exported_textures_exist():
+                        debug_logging.log("Skipped exporting unchanged texture set for material: {0}".format(active_material.name))
+                        self._texture_channel_index = len(self._texture_channels_to_bake) - 1
+                        self._skipped_material = True
 
-                # If an image was baked, pack it in the blend files data.
-                bake_image = bpy.data.images.get(self._bake_image_name)
-                if bake_image != None:
-                    if not bake_image.packed_file:
-                        bake_image.pack()
-                        debug_logging.log("Baked - (texture channel - active material): {0} - {1}".format(self._bake_image_name, bpy.context.active_object.active_material.name))
-                
                 # Start baking the next material channel.
-                texture_export_settings = bpy.context.scene.rymat_texture_export_settings
+                # The previously baked image is packed before the next bake job starts, blend data shouldn't be changed while a bake job is running.
                 if self._texture_channel_index < len(self._texture_channels_to_bake) - 1:
+                    self.pack_baked_image(self._bake_image_name, active_object)
                     self._texture_channel_index += 1
-                    self._bake_image_name = ""
-                    if texture_export_settings.export_mode == 'SINGLE_TEXTURE_SET':
-                        self._bake_image_name = bake_material_channel(self._texture_channels_to_bake[self._texture_channel_index], single_texture_set=True)
-                    else:
-                        self._bake_image_name = bake_material_channel(self._texture_channels_to_bake[self._texture_channel_index], single_texture_set=False)
+                    self._bake_image_name = bake_material_channel(self._texture_channels_to_bake[self._texture_channel_index], single_texture_set=single_texture_set)
 
                 else:
+                    # Pack the last baked image for the active material.
+                    self.pack_baked_image(self._bake_image_name, active_object)
+                    self._bake_image_name = ""
+
                     # If all of the textures are baked for the active material...
-                    if bpy.context.active_object.active_material_index + 1 < self._total_materials_to_bake:
-                        debug_logging.log("Completed baking textures for material: {0}".format(bpy.context.active_object.active_material.name))
+                    if active_object.active_material_index + 1 < self._total_materials_to_bake:
+                        debug_logging.log("Completed baking textures for material: {0}".format(active_object.active_material.name))
 
                         # Channel pack baked textures after baking each material unless we are baking to a single texture set.
-                        if texture_export_settings.export_mode != 'SINGLE_TEXTURE_SET':
-                            channel_pack_textures(bpy.context.active_object.active_material.name)
+                        # Skipped materials have no baked textures to channel pack.
+                        if not single_texture_set and not self._skipped_material:
+                            channel_pack_textures(active_object.active_material.name)
+                            self.record_export_hash(active_object)
 
                         # Move to baking the next material.
-                        bpy.context.active_object.active_material_index += 1
-                        while bau.verify_addon_material(bpy.context.active_object.active_material) == False and bpy.context.active_object.active_material_index + 1 < self._total_materials_to_bake:
-                            debug_logging.log("Skipped exporting texture set for invalid material (not created with this add-on): {0}".format(bpy.context.active_object.active_material.name))
-                            bpy.context.active_object.active_material_index += 1
+                        active_object.active_material_index += 1
+                        while bau.verify_addon_material(active_object.active_material) == False and active_object.active_material_index + 1 < self._total_materials_to_bake:
+                            debug_logging.log("Skipped exporting texture set for invalid material (not created with this add-on): {0}".format(active_object.active_material.name))
+                            active_object.active_material_index += 1
 
                         # Reset the texture channel index so all material channels are baked for the next material.
                         self._texture_channel_index = -1
+                        self._skipped_material = False
 
                         # Link the export UV map for the next material.
-                        active_material = bpy.context.active_object.active_material
+                        active_material = active_object.active_material
                         export_uv_map_node = material_layers.get_material_layer_node('EXPORT_UV_MAP')
                         bake_texture_node = active_material.node_tree.nodes.get('BAKE_IMAGE')
                         if export_uv_map_node and bake_texture_node:
                             active_material.node_tree.links.new(export_uv_map_node.outputs[0], bake_texture_node.inputs[0])
                     else:
                         # Channel pack textures.
-                        if texture_export_settings.export_mode == 'SINGLE_TEXTURE_SET':
-                            channel_pack_textures(bpy.context.active_object.name)
-                        else:
-                            channel_pack_textures(bpy.context.active_object.active_material.name)
+                        if single_texture_set:
+                            channel_pack_textures(active_object.name)
+                        elif not self._skipped_material:
+                            channel_pack_textures(active_object.active_material.name)
+                            self.record_export_hash(active_object)
                         
                         # De-isolating materials directly after their finished baking will cause errors.
                         # De-isolate all materials at the end of baking.
-                        for i in range(0, len(bpy.context.active_object.material_slots)):
-                            bpy.context.active_object.active_material_index = i
-                            if bau.verify_addon_material(bpy.context.active_object.material_slots[i].material):
-                                material_layers.show_layer()
+                        self.show_materials(active_object)
 
                         material_layers.refresh_layer_stack()
                         self.finish(context)
@@ -1004,42 +1238,51 @@ class RYMAT_OT_export(Operator):
         self._start_bake_time = time.time()
 
         # Pause auto updating for add-on properties, they will cause errors while baking.
-        bpy.context.scene.pause_auto_updates = True
+        scene = context.scene
+        scene.pause_auto_updates = True
         
         # Set the viewport shading mode to 'Material' so users can monitor the baking process.
-        bpy.context.space_data.shading.type = 'MATERIAL'
+        context.space_data.shading.type = 'MATERIAL'
 
         # Compile a list of material channels that require baking based on settings.
         self._texture_channels_to_bake = get_texture_channel_bake_list()
 
         # Get the number of materials to bake and export.
-        texture_export_settings = bpy.context.scene.rymat_texture_export_settings
+        active_object = context.active_object
+        bake_settings = scene.render.bake
+        texture_export_settings = scene.rymat_texture_export_settings
+
+        # Remember the original render engine and bake settings so they can be reset after baking.
+        self._original_render_engine_name = scene.render.engine
+        self._original_bake_settings = {key: getattr(bake_settings, key) for key in EXPORT_BAKE_SETTINGS}
+        self._original_samples = scene.cycles.samples
+
         match texture_export_settings.export_mode:
             case 'ONLY_ACTIVE_MATERIAL':
                 debug_logging.log("Starting exporting for only the active material...")
                 self._total_materials_to_bake = 1
-                bpy.context.scene.render.bake.use_clear = True
+                bake_settings.use_clear = True
 
             case 'EXPORT_ALL_MATERIALS':
                 debug_logging.log("Starting exporting for all materials as individual texture sets...")
-                self._total_materials_to_bake = len(bpy.context.active_object.material_slots)
-                bpy.context.active_object.active_material_index = 0
-                bpy.context.scene.render.bake.use_clear = True
+                self._total_materials_to_bake = len(active_object.material_slots)
+                active_object.active_material_index = 0
+                bake_settings.use_clear = True
 
             case 'SINGLE_TEXTURE_SET':
                 debug_logging.log("Starting exporting for all materials to a single texture set...")
-                self._total_materials_to_bake = len(bpy.context.active_object.material_slots)
-                bpy.context.active_object.active_material_index = 0
-                bpy.context.scene.render.bake.use_clear = False
+                self._total_materials_to_bake = len(active_object.material_slots)
+                active_object.active_material_index = 0
+                bake_settings.use_clear = False
 
                 # Textures aren't cleared when baking to a single texture set.
                 # Delete any baked material channel images to ensure they are blank before baking the first material.
+                object_name = active_object.name.replace('_', '')
                 for texture_channel_name in self._texture_channels_to_bake:
                     if texture_channel_name == 'NORMAL_HEIGHT':
                         channel_name = 'NORMAL'
                     else:
                         channel_name = texture_channel_name
-                    object_name = bpy.context.active_object.name.replace('_', '')
                     image_name = format_baked_material_channel_name(object_name, channel_name)
                     export_image = bpy.data.images.get(image_name)
                     if export_image:
@@ -1047,24 +1290,36 @@ class RYMAT_OT_export(Operator):
 
         # If there are no texture channels to bake, channel pack and finish.
         if len(self._texture_channels_to_bake) <= 0:
+            self.restore_render_settings(context)
+            scene.pause_auto_updates = False
             debug_logging.log_status("No texture channels to bake.", self, type='INFO')
             return {'FINISHED'}
         
-        # Add texture nodes to bake to.
-        add_bake_texture_nodes()
+        # Force save all textures (unsaved textures will be cleared and not bake properly).
+        # This is done once here for the whole batch, rather than for each baked material channel.
+        bau.force_save_all_textures()
 
-        # Remember the original render engine so we can reset it after baking.
-        bpy.context.scene.render.engine = 'CYCLES'
-        self._original_render_engine_name = bpy.context.scene.render.engine
+        # Hash materials before bake nodes are added, so texture sets for materials that haven't changed since they were last exported can be skipped.
+        self._material_export_hashes = {}
+        self._skipped_material = False
+        if texture_export_settings.export_mode != 'SINGLE_TEXTURE_SET':
+            mesh_hash_data = get_mesh_hash_data(active_object)
+            for material_slot in active_object.material_slots:
+                material = material_slot.material
+                if bau.verify_addon_material(material):
+                    self._material_export_hashes[material.name] = get_material_export_hash(material, mesh_hash_data)
 
-        # Apply baking settings for exporting textures.
-        baking_settings = bpy.context.scene.rymat_baking_settings
-        bpy.context.scene.render.bake.margin = baking_settings.uv_padding
-        bpy.context.scene.render.bake.use_selected_to_active = False
-        bpy.context.scene.cycles.samples = texture_export_settings.samples
+        # Add texture nodes to bake to.
+        add_bake_texture_nodes()
 
-        # Force save all textures (unsaved textures will be cleared and not bake properly).
-        bau.force_save_all_textures()
+        # Apply the render engine and baking settings for exporting textures once for all baked material channels.
+        scene.render.engine = 'CYCLES'
+        baking_settings = scene.rymat_baking_settings
+        bake_settings.margin = baking_settings.uv_padding
+        bake_settings.use_selected_to_active = False
+        bake_settings.use_pass_direct = False
+        bake_settings.use_pass_indirect = False
+        scene.cycles.samples = texture_export_settings.samples
 
         # Add a timer to provide periodic timer events.
         wm = context.window_manager
@@ -1074,13 +1329,45 @@ class RYMAT_OT_export(Operator):
         # Baking will start automatically when the timer hits the first event.
         return {'RUNNING_MODAL'}
 
+    def restore_render_settings(self, context):
+        '''Resets the render engine and bake settings changed for exporting to their original values.'''
+        scene = context.scene
+        scene.render.engine = self._original_render_engine_name
+        bake_settings = scene.render.bake
+        for key, value in self._original_bake_settings.items():
+            setattr(bake_settings, key, value)
+        scene.cycles.samples = self._original_samples
+
+    def show_materials(self, active_object):
+        '''Removes bake node isolation from all materials on the provided object by re-linking their shader nodes to the material output.'''
+        material_slots = active_object.material_slots
+        for i in range(0, len(material_slots)):
+            active_object.active_material_index = i
+            if bau.verify_addon_material(material_slots[i].material):
+                material_layers.show_layer()
+
+    def pack_baked_image(self, image_name, active_object):
+        '''If an image was baked, pack it in the blend files data.'''
+        bake_image = bpy.data.images.get(image_name)
+        if bake_image != None:
+            if not bake_image.packed_file:
+                bake_image.pack()
+                debug_logging.log("Baked - (texture channel - active material): {0} - {1}".format(image_name, active_object.active_material.name))
+
+    def record_export_hash(self, active_object):
+        '''Records the export hash for the active material after its texture set is exported.'''
+        active_material = active_object.active_material
+        material_export_hash = self._material_export_hashes.get(active_material.name)
+        if material_export_hash != None:
+            LAST_EXPORT_HASHES[(active_object.name, active_material.name)] = material_export_hash
+
     def cancel(self, context):
         # Remove the timer.
         if self._timer:
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
 
-        bpy.context.scene.render.engine = self._original_render_engine_name
+        self.restore_render_settings(context)
         remove_bake_texture_nodes()
         delete_bake_node()
         material_layers.refresh_layer_stack()
@@ -1093,7 +1380,7 @@ class RYMAT_OT_export(Operator):
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
 
-        bpy.context.scene.render.engine = self._original_render_engine_name
+        self.restore_render_settings(context)
         remove_bake_texture_nodes()
         delete_bake_node()
         material_layers.refresh_layer_stack()
@@ -53,7 +53,7 @@ def save_raw_image(original_image_path, original_image_name):
 
         # Save the raw texture in a folder next to the saved blend file if it doesn't exist within that folder.
         original_file_format = os.path.splitext(original_image_path)
-        destination_path = "{0}/{1}{2}".format(rymat_raw_textures_folder_path, original_image_name, original_file_format[1])
+        destination_path = os.path.join(rymat_raw_textures_folder_path, "{0}{1}".format(original_image_name, original_file_format[1]))
         if not os.path.exists(destination_path):
             shutil.copyfile(original_image_path, destination_path)
             debug_logging.log("Imported image copied to the raw texture folder.")
@@ -7,6 +7,27 @@ from ..core import material_layers
 from ..core import blender_addon_utils as bau
 from ..core import debug_logging
 
+# Names of nodes that can be found within mask node trees using get_mask_node.
+MASK_GROUP_NODE_NAMES = frozenset((
+    'GROUP_INPUT',
+    'GROUP_OUTPUT',
+    'MASK_TYPE',
+    'MASK_MIX',
+    'FILTER',
+    'PROJECTION',
+    'DECAL_COORDINATES',
+    'DECAL_OFFSET',
+    'TRIPLANAR_BLEND',
+    'TEXTURE',
+    'BLUR',
+    'AMBIENT_OCCLUSION',
+    'CURVATURE',
+    'THICKNESS',
+    'NORMALS',
+    'WORLD_SPACE_NORMALS',
+    'SEPARATE_RGB'
+))
+
 def update_selected_mask_index(self, context):
     '''Updates properties when the selected mask slot is changed.'''
     selected_layer_index = context.scene.rymat_layer_stack.selected_layer_index
@@ -26,22 +47,11 @@ def parse_mask_layer_index(mask_group_node_name):
             return int(indicies[1])
     return -1
 
-def parse_mask_index(mask_group_node_name):
-    '''Return the mask's index by parsing the mask group node name. Returns -1 if there is no active object.'''
-    active_object = bpy.context.active_object
-    if active_object:
-        active_material = active_object.active_material
-        if active_material:
-            indicies = mask_group_node_name[len(active_object.name):]
-            indicies = indicies.split('_')
-            return int(indicies[2])
-    return -1
-
 def format_mask_name(layer_index, mask_index, material_name=""):
     '''Returns a properly formatted name for a mask node created with this add-on.'''
     if material_name == "":
         material_name = bpy.context.active_object.active_material.name
-    return "{0}_{1}_{2}".format(material_name, str(layer_index), str(mask_index))
+    return f"{material_name}_{layer_index}_{mask_index}"
 
 def get_mask_node_tree(layer_index, mask_index, active_material_name=""):
     '''Returns the mask node tree / node group at the provided layer and mask index.'''
@@ -58,131 +68,31 @@ def get_mask_node(node_name, layer_index, mask_index, node_number=1, get_changed
     if active_material == None:
         return None
 
-    match node_name:
-        case 'MASK':
-            mask_node_name = format_mask_name(layer_index, mask_index)
-            if get_changed:
-                mask_node_name += "~"
-            return active_material.node_tree.nodes.get(mask_node_name)
-
-        case 'GROUP_INPUT':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('GROUP_INPUT')
-            return None     
-
-        case 'GROUP_OUTPUT':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('GROUP_OUTPUT')
-            return None    
-
-        case 'MASK_TYPE':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('MASK_TYPE')
-            return None     
-
-        case 'MASK_MIX':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('MASK_MIX')
-            return None
-
-        case 'FILTER':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('FILTER')
-            return None
-
-        case 'PROJECTION':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('PROJECTION')
-            return None
-
-        case 'DECAL_COORDINATES':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('DECAL_COORDINATES')
-            return None
-
-        case 'DECAL_OFFSET':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('DECAL_OFFSET')
-            return None
-
-        case 'TRIPLANAR_BLEND':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('TRIPLANAR_BLEND')
-            return None
-
-        case 'TEXTURE':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("TEXTURE_{0}".format(node_number))
-            return None
-        
-        case 'BLUR':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('BLUR')
-            return None        
-
-        case 'AMBIENT_OCCLUSION':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('AMBIENT_OCCLUSION')
-            return None
-
-        case 'CURVATURE':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('CURVATURE')
-            return None
-        
-        case 'THICKNESS':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('THICKNESS')
-            return None
-        
-        case 'NORMALS':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('NORMALS')
-            return None
-        
-        case 'WORLD_SPACE_NORMALS':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('WORLD_SPACE_NORMALS')
-            return None
-        
-        case 'SEPARATE_RGB':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('SEPARATE_RGB')
-            return None
+    # Format the mask name once using the active material name, it's used to find both mask nodes and mask node trees.
+    mask_group_node_name = format_mask_name(layer_index, mask_index, active_material.name)
+
+    if node_name == 'MASK':
+        mask_node_name = mask_group_node_name
+        if get_changed:
+            mask_node_name += "~"
+        return active_material.node_tree.nodes.get(mask_node_name)
+
+    # All other nodes are found within the mask node tree.
+    if node_name not in MASK_GROUP_NODE_NAMES:
+        return None
+
+    node_tree = bpy.data.node_groups.get(mask_group_node_name)
+    if not node_tree:
+        return None
+
+    if node_name == 'TEXTURE':
+        return node_tree.nodes.get(f"TEXTURE_{node_number}")
+    return node_tree.nodes.get(node_name)
+
+def get_mask_node_index(active_material):
+    '''Returns a dictionary of all mask nodes in the provided material keyed by node name, found in a single pass over the material nodes.'''
+    mask_name_prefix = f"{active_material.name}_"
+    return {node.name: node for node in active_material.node_tree.nodes if node.name.startswith(mask_name_prefix)}
 
 def get_mask_type(layer_index, mask_index):
     '''Returns the mask type by returning the label of the mask type node from the mask group node.'''
@@ -217,29 +127,32 @@ def add_mask_slot():
     mask_slot = masks.add()
 
     # This allows the layer slot array index to be found using the name of the layer slot as a key.
-    # Assign a random, unique number to the layer slot. 
-    unique_random_slot_id = str(random.randrange(0, 999999))
-    while masks.find(unique_random_slot_id) != -1:
-        unique_random_slot_id = str(random.randrange(0, 999999))
-    mask_slot.name = unique_random_slot_id
+    # Assign a unique number to the layer slot from an incrementing counter (avoids searching existing slots for a free random number).
+    mask_slot.name = str(mask_stack.next_slot_id)
+    mask_stack.next_slot_id += 1
+
+    # Read the mask count and selected index once, they are used to find where the new mask slot is moved to.
+    mask_count = len(masks)
+    selected_index = mask_stack.selected_index
+    move_index = mask_count - 1
 
     # If there is no layer selected, move the layer to the top of the stack.
-    if bpy.context.scene.rymat_mask_stack.selected_index < 0:
-        move_index = len(masks) - 1
+    if selected_index < 0:
         move_to_index = 0
         masks.move(move_index, move_to_index)
         mask_stack.layer_index = move_to_index
-        bpy.context.scene.rymat_mask_stack.selected_index = len(masks) - 1
+        mask_stack.selected_index = move_index
 
     # Moves the new layer above the currently selected layer and selects it.
     else: 
-        move_index = len(masks) - 1
-        move_to_index = max(0, min(bpy.context.scene.rymat_mask_stack.selected_index + 1, len(masks) - 1))
+        move_to_index = selected_index + 1
+        if move_to_index > move_index:
+            move_to_index = move_index
         masks.move(move_index, move_to_index)
         mask_stack.layer_index = move_to_index
-        bpy.context.scene.rymat_mask_stack.selected_index = max(0, min(bpy.context.scene.rymat_mask_stack.selected_index + 1, len(masks) - 1))
+        mask_stack.selected_index = move_to_index
 
-    return bpy.context.scene.rymat_mask_stack.selected_index
+    return mask_stack.selected_index
 
 def add_layer_mask(type, self):
     '''Adds a mask of the specified type to the selected material layer.'''
@@ -279,21 +192,21 @@ def add_layer_mask(type, self):
             image_name = "Mask_" + str(random.randrange(10000,99999))
             while bpy.data.images.get(image_name) != None:
                 image_name = "Mask_" + str(random.randrange(10000,99999))
-            bpy.ops.image.new(name=image_name, 
-                              width=tss.get_texture_width(), 
-                              height=tss.get_texture_height(), 
-                              color=(0.0, 0.0, 0.0, 1.0), 
-                              alpha=False, generated_type='BLANK', 
-                              float=True, 
-                              use_stereo_3d=False, 
-                              tiled=False)
+            new_image = bau.create_image(
+                new_image_name=image_name,
+                image_width=tss.get_texture_width(),
+                image_height=tss.get_texture_height(),
+                base_color=(0.0, 0.0, 0.0, 1.0),
+                generate_type='BLANK',
+                alpha_channel=False,
+                thirty_two_bit=True
+            )
             
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
 
             texture_node = get_mask_node('TEXTURE', selected_layer_index, new_mask_slot_index)
-            new_image = bpy.data.images.get(image_name)
             if texture_node and new_image:
                 texture_node.image = new_image
 
@@ -312,21 +225,21 @@ def add_layer_mask(type, self):
             image_name = "Mask_" + str(random.randrange(10000,99999))
             while bpy.data.images.get(image_name) != None:
                 image_name = "Mask_" + str(random.randrange(10000,99999))
-            bpy.ops.image.new(name=image_name, 
-                              width=tss.get_texture_width(), 
-                              height=tss.get_texture_height(), 
-                              color=(1.0, 1.0, 1.0, 1.0), 
-                              alpha=False, generated_type='BLANK', 
-                              float=True, 
-                              use_stereo_3d=False, 
-                              tiled=False)
+            new_image = bau.create_image(
+                new_image_name=image_name,
+                image_width=tss.get_texture_width(),
+                image_height=tss.get_texture_height(),
+                base_color=(1.0, 1.0, 1.0, 1.0),
+                generate_type='BLANK',
+                alpha_channel=False,
+                thirty_two_bit=True
+            )
             
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
 
             texture_node = get_mask_node('TEXTURE', selected_layer_index, new_mask_slot_index)
-            new_image = bpy.data.images.get(image_name)
             if texture_node and new_image:
                 texture_node.image = new_image
 
@@ -481,9 +394,11 @@ def delete_layer_mask(self):
     if bau.verify_material_operation_context(self) == False:
         return
 
-    masks = bpy.context.scene.rymat_masks
-    selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
-    selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
+    scene = bpy.context.scene
+    masks = scene.rymat_masks
+    mask_stack = scene.rymat_mask_stack
+    selected_layer_index = scene.rymat_layer_stack.selected_layer_index
+    selected_mask_index = mask_stack.selected_index
     active_material = bpy.context.active_object.active_material
 
     # Remove the mask node and it's node tree.
@@ -500,7 +415,7 @@ def delete_layer_mask(self):
 
     # Remove the mask slot and reset the mask index.
     masks.remove(selected_mask_index)
-    bpy.context.scene.rymat_mask_stack.selected_index = max(min(selected_mask_index - 1, len(masks) - 1), 0)
+    mask_stack.selected_index = max(min(selected_mask_index - 1, len(masks) - 1), 0)
     debug_logging.log("Deleted layer mask.")
 
 def move_mask(direction, self):
@@ -508,14 +423,15 @@ def move_mask(direction, self):
     if bau.verify_material_operation_context(self) == False:
         return
 
-    masks = bpy.context.scene.rymat_masks
-    selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+    scene = bpy.context.scene
+    masks = scene.rymat_masks
+    mask_stack = scene.rymat_mask_stack
+    selected_layer_index = scene.rymat_layer_stack.selected_layer_index
+    selected_mask_index = mask_stack.selected_index
 
     match direction:
         case 'UP':
             # Swap the mask node and node tree index for the selected mask node with the mask above it (if one exists).
-            selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
-
             if selected_mask_index < len(masks) - 1:
                 mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
                 mask_node.name += "~"
@@ -528,14 +444,12 @@ def move_mask(direction, self):
                 mask_node.name = format_mask_name(selected_layer_index, selected_mask_index + 1)
                 mask_node.node_tree.name = mask_node.name
 
-                bpy.context.scene.rymat_mask_stack.selected_index = selected_mask_index + 1
+                mask_stack.selected_index = selected_mask_index + 1
 
                 debug_logging.log("Moved mask up on the mask stack.")
 
         case 'DOWN':
             # Swap the mask node and node tree index for the selected mask node with the mask below it (if one exists).
-            selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
-
             if selected_mask_index - 1 >= 0:
                 mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
                 mask_node.name += "~"
@@ -548,7 +462,7 @@ def move_mask(direction, self):
                 mask_node.name = format_mask_name(selected_layer_index, selected_mask_index - 1)
                 mask_node.node_tree.name = mask_node.name
 
-                bpy.context.scene.rymat_mask_stack.selected_index = selected_mask_index - 1
+                mask_stack.selected_index = selected_mask_index - 1
 
                 debug_logging.log("Moved mask down on the mask stack.")
 
@@ -557,48 +471,77 @@ def move_mask(direction, self):
     
 def reindex_masks(change_made, layer_index, affected_mask_index):
     '''Reindexes mask nodes and node trees. This should be called after a change is made that effects the mask stack order (adding, duplicating, deleting a mask).'''
+    active_object = bpy.context.active_object
+    if not active_object or not active_object.active_material:
+        return
+    active_material = active_object.active_material
+    mask_count = len(bpy.context.scene.rymat_masks)
+
+    # Find all mask nodes in a single pass over the material nodes, rather than searching the nodes by name for each mask.
+    mask_nodes = get_mask_node_index(active_material)
+
     match change_made:
         case 'ADDED_MASK':
-            # Increase the layer index for all layer group nodes and their node trees that exist above the affected layer.
-            total_masks = len(bpy.context.scene.rymat_masks)
-            for i in range(total_masks, affected_mask_index, -1):
-                mask_node = get_mask_node('MASK', layer_index, i - 1)
+            # Collect the renames for all mask nodes that exist above the affected mask first, highest index first so no mask is renamed to a name that is still in use.
+            # The new (or duplicated) mask node is renamed last, once the index it takes has been freed.
+            material_name = active_material.name
+            mask_renames = []
+            for i in range(mask_count, affected_mask_index, -1):
+                mask_node = mask_nodes.get(format_mask_name(layer_index, i - 1, material_name))
                 if mask_node:
-                    mask_index = parse_mask_index(mask_node.name)
-                    mask_node_name = format_mask_name(layer_index, mask_index + 1)
-                    mask_node.name = mask_node_name
-                    mask_node.node_tree.name = mask_node_name
+                    mask_renames.append((mask_node, format_mask_name(layer_index, i, material_name)))
 
-            new_mask_node = get_mask_node('MASK', layer_index, affected_mask_index, get_changed=True)
+            new_mask_node = mask_nodes.get(format_mask_name(layer_index, affected_mask_index, material_name) + "~")
             if new_mask_node:
-                mask_node_name = format_mask_name(layer_index, affected_mask_index)
-                new_mask_node.name = mask_node_name
-                new_mask_node.node_tree.name = mask_node_name
+                mask_renames.append((new_mask_node, format_mask_name(layer_index, affected_mask_index, material_name)))
+
+            # Apply all renames in a single pass, renaming each mask node and it's node tree once.
+            for mask_node, mask_node_name in mask_renames:
+                mask_node.name = mask_node_name
+                mask_node.node_tree.name = mask_node_name
             debug_logging.log("Re-indexed masks for a new added / duplicated mask.")
 
         case 'DELETED_MASK':
             # Reduce the layer index for all layer group nodes and their nodes trees that exist above the affected layer.
-            mask_count = len(bpy.context.scene.rymat_masks)
             for i in range(affected_mask_index + 1, mask_count):
-                mask_node = get_mask_node('MASK', layer_index, i)
-                mask_index = parse_mask_index(mask_node.name)
-                mask_node.name = format_mask_name(layer_index, mask_index - 1)
-                mask_node.node_tree.name = mask_node.name
+                mask_node = mask_nodes.get(format_mask_name(layer_index, i, active_material.name))
+                if mask_node:
+                    mask_node.name = format_mask_name(layer_index, i - 1, active_material.name)
+                    mask_node.node_tree.name = mask_node.name
             debug_logging.log("Re-indexed mask nodes for after a mask was deleted.")
 
 def organize_mask_nodes():
     '''Organizes the position of all mask nodes in the active materials node tree.'''
+    active_object = bpy.context.active_object
+    if not active_object or not active_object.active_material:
+        return
+    active_material = active_object.active_material
+
+    # Find all mask nodes in a single pass over the material nodes, rather than searching the nodes by name for each mask.
+    mask_nodes = get_mask_node_index(active_material)
+
+    # Calculate the target location for all mask nodes first.
+    mask_node_locations = []
     layer_count = material_layers.count_layers()
     for i in range(0, layer_count):
         layer_node = material_layers.get_material_layer_node('LAYER', i)
-        position_y = layer_node.location[1] - 1250
-        mask_count = count_masks(i)
+
+        # Read the layer node location once, each access to the location creates a new vector.
+        position_x, position_y = layer_node.location
+        position_y -= 1250
+        mask_count = count_masks(i, active_material.name)
         for c in range(mask_count, 0, -1):
-            mask_node = get_mask_node('MASK', i, c - 1)
+            mask_node = mask_nodes.get(format_mask_name(i, c - 1, active_material.name))
             if mask_node:
-                mask_node.location = (layer_node.location[0], position_y)
-                mask_node.width = 300
+                mask_node_locations.append((mask_node, (position_x, position_y)))
                 position_y -= 300
+
+    # Apply the locations in a single pass, only writing to nodes that have moved or been resized so unchanged nodes aren't tagged for an update.
+    for mask_node, location in mask_node_locations:
+        if tuple(mask_node.location) != location:
+            mask_node.location = location
+        if mask_node.width != 300:
+            mask_node.width = 300
     debug_logging.log("Organized masks nodes.")
 
 def link_mask_nodes(layer_index):
@@ -613,34 +556,72 @@ def link_mask_nodes(layer_index):
     node_tree = active_material.node_tree
     mask_count = count_masks(layer_index)
 
+    # Get all mask nodes for the layer once, they are used for both disconnecting and re-connecting masks.
+    mask_node_index = get_mask_node_index(active_material)
+    mask_nodes = [mask_node_index.get(format_mask_name(layer_index, i, active_material.name)) for i in range(0, mask_count)]
+    layer_node = material_layers.get_material_layer_node('LAYER', layer_index)
+
+    # Skip re-linking if the mask nodes are already linked correctly, changing links causes the material shader to recompile.
+    if verify_mask_links(mask_nodes, layer_node):
+        debug_logging.log("Mask nodes are already linked.", sub_process=True)
+        return
+
     # Disconnect all mask group nodes.
-    for i in range(0, mask_count):
-        mask_node = get_mask_node('MASK', layer_index, i)
+    # Collect the links first and then remove them, rather than removing links from inputs while iterating them.
+    links_to_remove = []
+    for mask_node in mask_nodes:
         if mask_node:
             for input in mask_node.inputs:
-                if input.name != 'Blur Noise':
-                    for link in input.links:
-                        node_tree.links.remove(link)
-
-    # Re-connect all mask group nodes.
-    for i in range(0, mask_count):
-        mask_node = get_mask_node('MASK', layer_index, i)
-        next_mask_node = get_mask_node('MASK', layer_index, i + 1)
-        if next_mask_node:
+                if input.name != 'Blur Noise' and input.is_linked:
+                    links_to_remove.extend(input.links)
+
+    for link in links_to_remove:
+        node_tree.links.remove(link)
+
+    # Re-connect all mask group nodes, pairing each mask node with the next mask node in the stack.
+    for mask_node, next_mask_node in zip(mask_nodes, mask_nodes[1:]):
+        if mask_node and next_mask_node:
             bau.safe_node_link(
                 mask_node.outputs[0], 
                 next_mask_node.inputs.get('Mix'), 
                 node_tree
             )
 
-    # Connect the last layer node.
-    layer_node = material_layers.get_material_layer_node('LAYER', layer_index)
-    last_mask_node = get_mask_node('MASK', layer_index, mask_count - 1)
-    if last_mask_node and last_mask_node:
-        node_tree.links.new(last_mask_node.outputs[0], layer_node.inputs.get('Layer Mask'))
+    # Connect the last mask node to the layer node.
+    if mask_nodes and mask_nodes[-1] and layer_node:
+        node_tree.links.new(mask_nodes[-1].outputs[0], layer_node.inputs.get('Layer Mask'))
 
     debug_logging.log("Re-linked mask nodes.")
 
+def verify_mask_links(mask_nodes, layer_node):
+    '''Returns true if the provided mask nodes are only linked to each other in order, and the last mask node is linked to the layer node.'''
+    if None in mask_nodes or not layer_node:
+        return False
+
+    # Each mask node should only be linked to the mask node before it through it's mix input (blur noise links are ignored).
+    for i, mask_node in enumerate(mask_nodes):
+        for input in mask_node.inputs:
+            if input.name == 'Blur Noise':
+                continue
+
+            if i > 0 and input.name == 'Mix':
+                links = input.links
+                if len(links) != 1 or links[0].from_socket != mask_nodes[i - 1].outputs[0]:
+                    return False
+
+            elif input.is_linked:
+                return False
+
+    # The last mask node should be linked to the layer node.
+    if len(mask_nodes) > 0:
+        layer_mask_input = layer_node.inputs.get('Layer Mask')
+        if not layer_mask_input or not layer_mask_input.is_linked:
+            return False
+        if layer_mask_input.links[0].from_socket != mask_nodes[-1].outputs[0]:
+            return False
+
+    return True
+
 def link_mask_blur(mask_group_node, active_material):
     '''Links the blur noise texture to mask node inputs to allow them to blur.'''
     if "Blur Noise" in mask_group_node.inputs:
@@ -652,15 +633,16 @@ def refresh_mask_slots():
     '''Refreshes the number of mask slots in the mask stack by counting the number of mask nodes in the active materials node tree.'''
     active_object = bpy.context.active_object
     if active_object:
-        masks = bpy.context.scene.rymat_masks
-        selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+        scene = bpy.context.scene
+        masks = scene.rymat_masks
+        selected_layer_index = scene.rymat_layer_stack.selected_layer_index
+        active_material = active_object.active_material
         masks.clear()
         mask_count = count_masks(selected_layer_index)
         for i in range(0, mask_count):
 
             # If the group node belongs to the active material (indicated by it's name)...
             # but isn't being used, it can cause conflicts or errors, and it should not exist, delete it.
-            active_material = active_object.active_material
             if active_material:
                 mask_node_tree = get_mask_node_tree(selected_layer_index, i)
                 if mask_node_tree.users <= 0:
@@ -675,12 +657,22 @@ def relink_image_mask_projection(original_output_channel):
     selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
     mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
-    projection_node = get_mask_node('PROJECTION', selected_layer_index, selected_mask_index)
-    blur_node = get_mask_node('BLUR', selected_layer_index, selected_mask_index)
-    filter_node = get_mask_node('FILTER', selected_layer_index, selected_mask_index)
-    texture_node = get_mask_node('TEXTURE', selected_layer_index, selected_mask_index)
-    mix_node = get_mask_node('MASK_MIX', selected_layer_index, selected_mask_index)
-    group_input_node = get_mask_node('GROUP_INPUT', selected_layer_index, selected_mask_index)
+    if not mask_node or not mask_node.node_tree:
+        debug_logging.log(
+            "Can't relink image mask projection, mask node missing.",
+            message_type='ERROR',
+            sub_process=False
+        )
+        return
+
+    # Get nodes directly from the mask node tree, rather than finding the mask node tree by name again for each node.
+    mask_tree_nodes = mask_node.node_tree.nodes
+    projection_node = mask_tree_nodes.get('PROJECTION')
+    blur_node = mask_tree_nodes.get('BLUR')
+    filter_node = mask_tree_nodes.get('FILTER')
+    texture_node = mask_tree_nodes.get('TEXTURE_1')
+    mix_node = mask_tree_nodes.get('MASK_MIX')
+    group_input_node = mask_tree_nodes.get('GROUP_INPUT')
 
     # If the mix node is missing, there's an error, abort.
     if not mix_node:
@@ -714,10 +706,10 @@ def relink_image_mask_projection(original_output_channel):
                 mask_links.new(projection_node.outputs[0], blur_node.inputs[2])
 
         case "RY_TriplanarProjection":
-            triplanar_blend_node = get_mask_node('TRIPLANAR_BLEND', selected_layer_index, selected_mask_index)
+            triplanar_blend_node = mask_tree_nodes.get('TRIPLANAR_BLEND')
 
             for i in range(0, 3):
-                texture_node = get_mask_node('TEXTURE', selected_layer_index, selected_mask_index, node_number=i + 1)
+                texture_node = mask_tree_nodes.get(f"TEXTURE_{i + 1}")
                 if texture_node:
                     mask_node.node_tree.links.new(projection_output_node.outputs[i], texture_node.inputs[0])
                     mask_node.node_tree.links.new(texture_node.outputs[0], triplanar_blend_node.inputs[i])
@@ -737,7 +729,7 @@ def relink_image_mask_projection(original_output_channel):
             mask_node.node_tree.links.new(projection_node.outputs[0], blur_node.inputs[0])
             mask_node.node_tree.links.new(projection_output_node.outputs[0], texture_node.inputs[0])
             mask_node.node_tree.links.new(texture_node.outputs[0], filter_node.inputs[0])
-            linear_mask_blend_node = mask_node.node_tree.nodes.get('LINEAR_MASK_BLEND')
+            linear_mask_blend_node = mask_tree_nodes.get('LINEAR_MASK_BLEND')
             mask_node.node_tree.links.new(filter_node.outputs[0], linear_mask_blend_node.inputs[0])
             mask_node.node_tree.links.new(projection_node.outputs[1], linear_mask_blend_node.inputs[1])
 
@@ -913,6 +905,7 @@ def set_mask_crgba_channel(output_channel):
 class RYMAT_mask_stack(PropertyGroup):
     '''Properties for the layer stack.'''
     selected_index: IntProperty(default=-1, description="Selected material filter index", update=update_selected_mask_index)
+    next_slot_id: IntProperty(default=0, description="Unique ID assigned to the next added mask slot")
 
 class RYMAT_masks(PropertyGroup):
     hidden: BoolProperty(name="Hidden", description="Show if the layer is hidden")
@@ -926,9 +919,9 @@ class RYMAT_UL_mask_list(bpy.types.UIList):
         self.use_filter_reverse = True
 
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            masks = bpy.context.scene.rymat_masks
-            item_index = masks.find(item.name)
-            selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+            # The index of the drawn item in the mask stack is provided, avoid searching the mask stack for the item.
+            item_index = index
+            selected_layer_index = context.scene.rymat_layer_stack.selected_layer_index
             mask_node = get_mask_node('MASK', selected_layer_index, item_index)
 
             if not mask_node:
@@ -956,271 +949,194 @@ class RYMAT_UL_mask_list(bpy.types.UIList):
 
             # Mask opacity and blending mode.
             row = second_column.row(align=True)
-            mask_mix_node = get_mask_node('MASK_MIX', selected_layer_index, item_index)
+            mask_mix_node = None
+            if mask_node.node_tree:
+                mask_mix_node = mask_node.node_tree.nodes.get('MASK_MIX')
             if mask_mix_node:
                 row.prop(mask_mix_node.inputs[0], "default_value", text="", emboss=True)
                 row.prop(mask_mix_node, "blend_type", text="")
 
-class RYMAT_OT_add_empty_layer_mask(Operator):
+class ActiveObjectPoll:
+    '''Shared poll for mask operators, disables the operator when there is no active object.'''
+    @ classmethod
+    def poll(cls, context):
+        return context.active_object
+
+class RYMAT_OT_add_empty_layer_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Empty Layer Mask"
     bl_idname = "rymat.add_empty_layer_mask"
     bl_description = "Adds an default image based node group mask with to the selected material layer and fills the image slot with a no image"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-    
     def execute(self, context):
         add_layer_mask('EMPTY', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_black_layer_mask(Operator):
+class RYMAT_OT_add_black_layer_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Black Layer Mask"
     bl_idname = "rymat.add_black_layer_mask"
     bl_description = "Adds an default image based node group mask with to the selected material layer and fills the image slot with a black image"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('BLACK', self)
         return {'FINISHED'}
     
-class RYMAT_OT_add_white_layer_mask(Operator):
+class RYMAT_OT_add_white_layer_mask(ActiveObjectPoll, Operator):
     bl_label = "Add White Layer Mask"
     bl_idname = "rymat.add_white_layer_mask"
     bl_description = "Adds an default image based node group mask with to the selected material layer and fills the image slot with a white image"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('WHITE', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_linear_gradient_mask(Operator):
+class RYMAT_OT_add_linear_gradient_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Linear Gradient Mask"
     bl_idname = "rymat.add_linear_gradient_mask"
     bl_description = "Adds a non-destructive linear gradient mask to the selected material layer"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('LINEAR_GRADIENT', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_grunge_mask(Operator):
+class RYMAT_OT_add_grunge_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Grunge Mask"
     bl_idname = "rymat.add_grunge_mask"
     bl_description = "Adds a mask that simulates grunge / dirt to the selected material layer"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('GRUNGE', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_edge_wear_mask(Operator):
+class RYMAT_OT_add_edge_wear_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Edge Wear Mask"
     bl_idname = "rymat.add_edge_wear_mask"
     bl_description = "Adds a mask that simulates edge wear to the selected material layer"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('EDGE_WEAR', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_decal_mask(Operator):
+class RYMAT_OT_add_decal_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Decal Mask"
     bl_idname = "rymat.add_decal_mask"
     bl_description = "Adds a mask with decal projection to the selected material layer"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('DECAL', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_ambient_occlusion_mask(Operator):
+class RYMAT_OT_add_ambient_occlusion_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Ambient Occlusion Mask"
     bl_idname = "rymat.add_ambient_occlusion_mask"
     bl_description = "Adds an image mask that will auto-fill the image with the ambient occlusion mesh map for the active object if one exists"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('AMBIENT_OCCLUSION', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_curvature_mask(Operator):
+class RYMAT_OT_add_curvature_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Curvature Mask"
     bl_idname = "rymat.add_curvature_mask"
     bl_description = "Adds an image mask that will auto-fill the image with the curvature mesh map for the active object if one exists"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('CURVATURE', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_thickness_mask(Operator):
+class RYMAT_OT_add_thickness_mask(ActiveObjectPoll, Operator):
     bl_label = "Add Thickness Mask"
     bl_idname = "rymat.add_thickness_mask"
     bl_description = "Adds an image mask that will auto-fill the image with the thickness mesh map for the active object if one exists"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('THICKNESS', self)
         return {'FINISHED'}
 
-class RYMAT_OT_add_world_space_normals_mask(Operator):
+class RYMAT_OT_add_world_space_normals_mask(ActiveObjectPoll, Operator):
     bl_label = "Add World Space Normals Mask"
     bl_idname = "rymat.add_world_space_normals_mask"
     bl_description = "Adds an image mask that will auto-fill the image with the world space normals mesh map for the active object if one exists"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         add_layer_mask('WORLD_SPACE_NORMALS', self)
         return {'FINISHED'}
 
-class RYMAT_OT_move_layer_mask_up(Operator):
+class RYMAT_OT_move_layer_mask_up(ActiveObjectPoll, Operator):
     bl_label = "Move Layer Mask Up"
     bl_idname = "rymat.move_layer_mask_up"
     bl_description = "Moves the selected layer mask up on the mask stack"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         move_mask('UP', self)
         return {'FINISHED'}
 
-class RYMAT_OT_move_layer_mask_down(Operator):
+class RYMAT_OT_move_layer_mask_down(ActiveObjectPoll, Operator):
     bl_label = "Move Layer Mask Down"
     bl_idname = "rymat.move_layer_mask_down"
     bl_description = "Moves the selected layer mask down on the mask stack"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-    
     def execute(self, context):
         move_mask('DOWN', self)
         return {'FINISHED'}
 
-class RYMAT_OT_duplicate_layer_mask(Operator):
+class RYMAT_OT_duplicate_layer_mask(ActiveObjectPoll, Operator):
     bl_label = "Duplicate Layer Mask"
     bl_idname = "rymat.duplicate_layer_mask"
     bl_description = "Duplicates the selected mask"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         duplicate_mask(self)
         return {'FINISHED'}
 
-class RYMAT_OT_delete_layer_mask(Operator):
+class RYMAT_OT_delete_layer_mask(ActiveObjectPoll, Operator):
     bl_label = "Delete Layer Mask"
     bl_idname = "rymat.delete_layer_mask"
     bl_description = "Deletes the selected mask from the selected material layer"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-    
     def execute(self, context):
         delete_layer_mask(self)
         return {'FINISHED'}
 
-class RYMAT_OT_set_mask_projection_uv(Operator):
+class RYMAT_OT_set_mask_projection_uv(ActiveObjectPoll, Operator):
     bl_label = "Set Mask Projection UV"
     bl_idname = "rymat.set_mask_projection_uv"
     bl_description = "Sets the projection mode for the selected mask to UV projection, which uses the UV layout of the object to project textures used on this material layer"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         original_output_channel = get_mask_crgba_channel()
         set_mask_projection_mode('UV')
         relink_image_mask_projection(original_output_channel)
         return {'FINISHED'}
 
-class RYMAT_OT_set_mask_projection_triplanar(Operator):
+class RYMAT_OT_set_mask_projection_triplanar(ActiveObjectPoll, Operator):
     bl_label = "Set Mask Projection Triplanar"
     bl_idname = "rymat.set_mask_projection_triplanar"
     bl_description = "Sets the projection mode for the mask to triplanar projection which projects the textures onto the object from each axis. This projection method can be used to apply materials to objects without needing to manually blend seams"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         original_output_channel = get_mask_crgba_channel()
         set_mask_projection_mode('TRIPLANAR')
         relink_image_mask_projection(original_output_channel)
         return {'FINISHED'}
 
-class RYMAT_OT_set_mask_crgba_channel(Operator):
+class RYMAT_OT_set_mask_crgba_channel(ActiveObjectPoll, Operator):
     bl_label = "Set Mask Output Channel"
     bl_idname = "rymat.set_mask_crgba_channel"
     bl_description = "Sets the channel used for the mask to the specified value. This allows for the use of RGBA channel packed masks, and using image transparency as a mask"
@@ -1228,16 +1144,11 @@ class RYMAT_OT_set_mask_crgba_channel(Operator):
 
     channel_name: StringProperty(default='COLOR', options={'HIDDEN'})
 
-    # Disable when there is no active object.
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         set_mask_crgba_channel(self.channel_name)
         return {'FINISHED'}
 
-class RYMAT_OT_isolate_mask(Operator):
+class RYMAT_OT_isolate_mask(ActiveObjectPoll, Operator):
     bl_label = "Isolate Mask"
     bl_idname = "rymat.isolate_mask"
     bl_description = "Isolates the specified mask"
@@ -1245,10 +1156,6 @@ class RYMAT_OT_isolate_mask(Operator):
 
     mask_index: IntProperty(default=-1, options={'HIDDEN'})
 
-    @ classmethod
-    def poll(cls, context):
-        return context.active_object
-
     def execute(self, context):
         if bau.verify_material_operation_context(self) == False:
             return {'FINISHED'}
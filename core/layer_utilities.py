@@ -375,7 +375,7 @@ class RYMAT_OT_merge_materials(Operator):
                             if duplicated_node_tree:
                                 new_layer_slot_index = material_layers.add_material_layer_slot()
 
-                                duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
+                                duplicated_node_tree.name = material_layers.format_layer_group_node_name(active_material.name, new_layer_slot_index)
                                 new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
                                 new_layer_group_node.node_tree = duplicated_node_tree
                                 new_layer_group_node.name = str(new_layer_slot_index) + "~"
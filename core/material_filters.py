@@ -91,7 +91,7 @@ FILTER_INFO = {
 def format_filter_name(material_channel_name, filter_index):
     '''Correctly formats the name of material filter nodes.'''
     static_channel_name = bau.format_static_matchannel_name(material_channel_name)
-    return "{0}_FILTER_{1}".format(static_channel_name, str(filter_index))
+    return f"{static_channel_name}_FILTER_{filter_index}"
 
 def count_filter_nodes(material_channel_name):
     '''Returns the total count of the number of filter nodes for the specified material channel.'''
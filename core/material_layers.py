@@ -14,7 +14,7 @@ import copy
 import random
 import time
 
-TRIPLANAR_PROJECTION_INPUTS = [
+TRIPLANAR_PROJECTION_INPUTS = (
     'X',
     'Y',
     'Z',
@@ -24,7 +24,7 @@ TRIPLANAR_PROJECTION_INPUTS = [
     'AxisMask',
     'Rotation',
     'SignedGeometryNormals'
-]
+)
 
 PROJECTION_TEXTURE_SAMPLE_COUNTS = {
     'UV': 1,
@@ -52,13 +52,13 @@ def format_material_channel_node_name(material_channel_name, node_name, node_ind
     '''Properly formats the name for a layer node that belongs to a material channel.'''
     static_channel_name = bau.format_static_matchannel_name(material_channel_name)
     if node_index != -1:
-        return "{0}-{1}-{2}".format(static_channel_name, node_name, node_index)
+        return f"{static_channel_name}-{node_name}-{node_index}"
     else:
-        return "{0}-{1}".format(static_channel_name, node_name)
+        return f"{static_channel_name}-{node_name}"
 
 def format_layer_group_node_name(material_name, layer_index):
     '''Properly formats the layer group node names for this add-on.'''
-    return "{0}_{1}".format(material_name, layer_index)
+    return f"{material_name}_{layer_index}"
 
 def update_layer_index(self, context):
     '''Updates properties and user interface when a new layer is selected.'''
@@ -968,7 +968,7 @@ def duplicate_layer(original_layer_index, self):
 
         new_layer_slot_index = add_material_layer_slot()
 
-        duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
+        duplicated_node_tree.name = format_layer_group_node_name(active_material.name, new_layer_slot_index)
         new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
         new_layer_group_node.node_tree = duplicated_node_tree
         new_layer_group_node.name = str(new_layer_slot_index) + "~"
@@ -2023,14 +2023,21 @@ def add_bake_texture_nodes():
     '''Adds a bake texture node to all materials in all material slots on the active object.'''
 
     # Adding a placeholder image to the bake image nodes stops Blender from throwing annoying and incorrect 'no active image' warnings when baking'.
-    placeholder_image = bau.create_data_image("RY_Placeholder", image_width=32, image_height=32)
+    placeholder_image = bpy.data.images.get("RY_Placeholder")
+    if not placeholder_image:
+        placeholder_image = bau.create_data_image("RY_Placeholder", image_width=32, image_height=32)
 
     active_object = bpy.context.active_object
     for material_slot in active_object.material_slots:
         if material_slot.material:
-            bake_texture_node = material_slot.material.node_tree.nodes.new('ShaderNodeTexImage')
-            bake_texture_node.name = 'BAKE_IMAGE'
-            bake_texture_node.label = bake_texture_node.name
+
+            # Reuse an existing bake texture node (i.e left from an interrupted bake) instead of adding a duplicate.
+            # Duplicate nodes would be renamed by Blender and never receive the bake image.
+            bake_texture_node = material_slot.material.node_tree.nodes.get('BAKE_IMAGE')
+            if not bake_texture_node:
+                bake_texture_node = material_slot.material.node_tree.nodes.new('ShaderNodeTexImage')
+                bake_texture_node.name = 'BAKE_IMAGE'
+                bake_texture_node.label = bake_texture_node.name
             bake_texture_node.image = placeholder_image
             bake_texture_node.select = True
             material_slot.material.node_tree.nodes.active = bake_texture_node
@@ -2671,8 +2678,8 @@ class RYMAT_OT_merge_with_layer_below(Operator):
         add_bake_texture_nodes()
 
         # Remember the original render engine so we can reset it after baking.
-        bpy.context.scene.render.engine = 'CYCLES'
         self._original_render_engine_name = bpy.context.scene.render.engine
+        bpy.context.scene.render.engine = 'CYCLES'
 
         # Apply baking settings.
         bpy.context.scene.render.bake.margin = 14
@@ -34,19 +34,19 @@ MESH_MAP_TYPES = (
     "WORLD_SPACE_NORMALS"
 )
 
-MESH_MAP_ANTI_ALIASING = [
+MESH_MAP_ANTI_ALIASING = (
     ("NO_AA", "No AA", "No anti aliasing will be applied to output mesh map textures"),
     ("2X", "2xAA", "Mesh maps will be rendered at 2x scale and then scaled down to effectively apply anti-aliasing"),
     ("4X", "4xAA", "Mesh maps will be rendered at 4x scale and then scaled down to effectively apply anti-aliasing")
-]
+)
 
-MESH_MAP_UPSCALE_MULTIPLIER = [
+MESH_MAP_UPSCALE_MULTIPLIER = (
     ("NO_UPSCALE", "No Upscale", "All mesh maps will be baked at the pixel resolution defined in this materials texture set"),
     ("1_75X", "1.75x Upscale", "All mesh maps will be baked at 0.75 of the pixel resolution defined in this materials texture set and then upscaled to match the texture set resolution"),
     ("2X", "2x Upscale", "All mesh maps will be baked at half of the pixel resolution defined in this materials texture set and then upscaled to match the texture set resolution")
-]
+)
 
-MESH_MAP_BAKING_QUALITY = [
+MESH_MAP_BAKING_QUALITY = (
     ("TEST_QUALITY", "Test Quality", "Test quality sampling, ideal for quickly testing the output of mesh map bakes. Not recommended for use in production (1 sample)"),
     ("EXTREMELY_LOW_QUALITY", "Extremely Low Quality", "Extremely low baking quality (8 samples), generally the result is too low quality for use in production"),
     ("LOW_QUALITY", "Low Quality", "Low baking quality, useful for when you want somewhat accurate mesh map data produced quickly (16 samples)"),
@@ -54,12 +54,12 @@ MESH_MAP_BAKING_QUALITY = [
     ("HIGH_QUALITY", "High Quality", "High baking quality, useful for when you want slightly more accurate mesh map data (64 samples)"),
     ("VERY_HIGH_QUALITY", "Very High Quality", "Very high quality sampling, for significantly more accurate mesh map data, not recommended for standard use, baking times will be long (128 samples)"),
     ("INSANE_QUALITY", "Insane Quality", "Very high sampling, for hyper accurate mesh map data output, not recommended for standard use. Render times are very long (256 samples)")
-]
+)
 
-MESH_MAP_CAGE_MODE = [
+MESH_MAP_CAGE_MODE = (
     ("NO_CAGE", "No Cage", "No cage will be used when baking mesh maps. This can in rare cases produce better results than using a cage"),
     ("MANUAL_CAGE", "Manual Cage", "Insert a manually created cage to be used when baking mesh maps. Baking using a cage can cause some skewing of the baked data if the cage extends too much, or missing normal data in areas where the geometry is not covered by the cage. For some objects that have small crevaces where cage mesh normals would intersect if extruded defining a manual cage object will produce the best results")
-]
+)
 
 
 #----------------------------- UPDATING FUNCTIONS -----------------------------#
@@ -212,7 +212,7 @@ def create_bake_image(mesh_map_type, object_name, baking_settings):
     )
 
     rymat_mesh_map_folder = blender_addon_utils.get_texture_folder_path(folder='MESH_MAPS')
-    mesh_map_image.filepath = "{0}/{1}.{2}".format(rymat_mesh_map_folder, mesh_map_image.name, 'png')
+    mesh_map_image.filepath = os.path.join(rymat_mesh_map_folder, "{0}.{1}".format(mesh_map_image.name, 'png'))
     mesh_map_image.file_format = 'PNG'
     mesh_map_image.colorspace_settings.name = 'Non-Color'
     mesh_map_image.use_fake_user = True
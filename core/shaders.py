@@ -14,7 +14,7 @@ from ..core import blender_addon_utils as bau
 from ..core import export_textures
 from .. import preferences
 
-LAYER_BLEND_MODES = [
+LAYER_BLEND_MODES = (
     ('MIX', "Mix", ""),
     ('DARKEN', "Darken", ""),
     ('MULTIPLY', "Multiply", ""),
@@ -36,36 +36,36 @@ LAYER_BLEND_MODES = [
     ('VALUE', "Value", ""),
     ('NORMAL_MAP_COMBINE', "Normal Map Combine", ""),
     ('NORMAL_MAP_DETAIL', "Normal Map Detail", "")
-]
+)
 
 # Valid node socket types for shader channels defined for this add-on.
-NODE_SOCKET_TYPES = [
+NODE_SOCKET_TYPES = (
     ("NodeSocketFloat", "Float", "Channel contains greyscale (0 - 1) data."),
     ("NodeSocketColor", "Color", "Channel contains RGBA data."),
     ("NodeSocketVector", "Vector", "Channel contains vector data."),
-]
+)
 
 # Valid float node socket subtypes for shader channels defined for this add-on.
-NODE_SOCKET_FLOAT_SUBTYPES = [
+NODE_SOCKET_FLOAT_SUBTYPES = (
     ("PERCENTAGE", "Percentage", ""),
     ("FACTOR", "Factor", "Define the socket property as a factor (makes the property a slider in the interface)."),
     ("ANGLE", "Angle", "Angle"),
     ("TIME", "Time", ""),
     ("DISTANCE", "Distance", "Distance")
-]
+)
 
 # Valid vector node socket subtypes for shader channels defined for this add-on.
-NODE_SOCKET_VECTOR_SUBTYPES = [
+NODE_SOCKET_VECTOR_SUBTYPES = (
     ("TRANSLATION", "Translation", "Translation"),
     ("DIRECTION", "Direction", "Direction"),
     ("VELOCITY", "Velocity", "Velocity"),
     ("ACCELERATION", "Acceleration", "Acceleration"),
     ("EULER_ANGLE", "Euler Angles", "Euler Angles"),
     ("XYZ", "XYZ", "XYZ")
-]
+)
 
 # Valid default image colorspace options.
-IMAGE_COLORSPACES = [
+IMAGE_COLORSPACES = (
     ('ACES2065-1', "ACES2065-1", "ACES2065-1"),
     ('ACEScg', "ACEScg", "ACEScg"),
     ('AgX Base Display P3', "AgX Base Display P3", "AgX Base Display P3"),
@@ -87,14 +87,14 @@ IMAGE_COLORSPACES = [
     ('Rec.1886', "Rec.1886", "Rec.1886"),
     ('Rec.2020', "Rec.2020", "Rec.2020"),
     ('sRGB', "sRGB", "sRGB")
-]
+)
 
-TEXTURE_INTERPOLATION = [
+TEXTURE_INTERPOLATION = (
     ('Linear', "Linear", "Linear"),
     ('Cubic', "Cubic", "Cubic"),
     ('Closest', "Closest", "Closest"),
     ('Smart', "Smart", "Smart")
-]
+)
 
 # Internal backup template for the shader json file.
 DEFAULT_SHADER_JSON = {
@@ -307,10 +307,8 @@ def get_shader_channel_socket_name(static_material_channel_name):
 
 def get_socket_subtype_enums(scene=None, context=None):
     '''Returns a list of valid socket subtypes in Blender enum format for the selected shader channel.'''
-    items = []
-
     # Add a 'NONE' option for when a node socket subtype isn't defined.
-    items += [("NONE", "None", "None")]
+    items = (("NONE", "None", "None"),)
 
     # Return an enum list of either float or vector node socket subtypes based on main node socket type.
     selected_shader_channel_index = bpy.context.scene.rymat_shader_channel_index
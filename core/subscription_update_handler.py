@@ -10,12 +10,17 @@ from ..core import blender_addon_utils
 from ..core import shaders
 
 
+# Delay in seconds before refreshing the layer stack after the active object changes.
+ACTIVE_OBJECT_REFRESH_DELAY = 0.1
+
+
 #----------------------------- SUBSCRIPTIONS -----------------------------#
 
 
 def sub_to_active_object_name(active_object):
     '''Re-subscribes to the active object's name.'''
     bpy.types.Scene.previous_object_name = active_object.name
+    bpy.types.Scene.previous_object_pointer = active_object.as_pointer()
     bpy.msgbus.clear_by_owner(bpy.types.Scene.active_object_name_sub_owner)
     bpy.msgbus.subscribe_rna(key=active_object.path_resolve("name", False), owner=bpy.types.Scene.active_object_name_sub_owner, notify=on_active_object_name_changed, args=())
     debug_logging.log("Re-subscribed to the active objects name.", sub_process=True)
@@ -155,16 +160,35 @@ def on_active_object_changed():
     if bpy.context.scene.pause_auto_updates:
         return
     
-    debug_logging.log("Active object changed...", sub_process=True)
     active_object = bpy.context.view_layer.objects.active
     if active_object:
+
+        # Notifications are sent when the active object is re-assigned, skip updates when the active object didn't change.
+        # The object pointer is compared along with the name, a new object (i.e restored with undo) can have the same name as the previous active object.
+        if active_object.name == bpy.types.Scene.previous_object_name and active_object.as_pointer() == getattr(bpy.types.Scene, 'previous_object_pointer', 0):
+            return
+
+        debug_logging.log("Active object changed...", sub_process=True)
         sub_to_active_object_name(active_object)
         sub_to_active_material_index(active_object)
         sub_to_active_material_name(active_object)
 
+        # Delay refreshing the layer stack so rapid active object changes only trigger a single refresh.
+        if not bpy.app.timers.is_registered(refresh_active_object):
+            bpy.app.timers.register(refresh_active_object, first_interval=ACTIVE_OBJECT_REFRESH_DELAY)
+
+def refresh_active_object():
+    '''Reads the shader and refreshes the layer stack for the active object. Registered as a timer when the active object changes.'''
+    if bpy.context.scene.pause_auto_updates:
+        return None
+
+    active_object = bpy.context.view_layer.objects.active
+    if active_object:
+
         # Read the shader from the active material if one exists.
         if active_object.active_material:
             shaders.read_shader(active_object.active_material)
 
         # Refresh the number of layers in the layer stack.
-        material_layers.refresh_layer_stack("Active object changed.")
\ No newline at end of file
+        material_layers.refresh_layer_stack("Active object changed.")
+    return None
\ No newline at end of file
@@ -8,7 +8,7 @@ from ..core import blender_addon_utils as bau
 from ..core import debug_logging
 
 # Available texture resolutions for texture sets.
-TEXTURE_SET_RESOLUTIONS = [
+TEXTURE_SET_RESOLUTIONS = (
     ("THIRTY_TWO", "32", ""),
     ("SIXTY_FOUR", "64", ""),
     ("ONE_TWENTY_EIGHT", "128", ""),
@@ -17,7 +17,7 @@ TEXTURE_SET_RESOLUTIONS = [
     ("ONE_K", "1024", ""),
     ("TWO_K", "2048", ""),
     ("FOUR_K", "4096", "")
-]
+)
 
 def update_match_image_resolution(self, context):
     texture_set_settings = context.scene.rymat_texture_set_settings
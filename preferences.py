@@ -6,10 +6,10 @@ from bpy.props import BoolProperty, IntProperty, EnumProperty
 
 ADDON_NAME = __package__
 
-DEFAULT_TEXTURE_SAVE_METHODS = [
+DEFAULT_TEXTURE_SAVE_METHODS = (
     ("PACK", "Pack", "Textures will be packed into the blend file by default"),
     ("SAVE_EXTERNALLY", "Save Externally", "Textures will be saved to the raw texture folder by default")
-]
+)
 
 class AddonPreferences(AddonPreferences):
     bl_idname = ADDON_NAME
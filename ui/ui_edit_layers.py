@@ -14,12 +14,12 @@ from .. import preferences
 STANDARD_UI_SPLIT = 0.4
 
 # Tabs to help organize the user interface and help limit the number of properties displayed at one time.
-MATERIAL_LAYER_PROPERTY_TABS = [
+MATERIAL_LAYER_PROPERTY_TABS = (
     ("MATERIAL_CHANNELS", "CHANNELS", "Properties of material channels for the selected layer"),
     ("PROJECTION", "PROJECTION", "Projection properties for the selected layer"),
     ("MASKS", "MASKS", "Properties for masks applied to the selected material layer"),
     ("UNLAYERED", "UNLAYERED", "Unlayered properties of the shader node")
-]
+)
 
 # User interface labels for group nodes.
 GROUP_NODE_UI_LABELS = {